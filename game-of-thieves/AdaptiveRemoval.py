@@ -0,0 +1,136 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+# Adaptive (recomputed) attacks: the nodes or edges are removed in batches and the GOT centrality is estimated again after each
+# batch, instead of removing them in the order computed once on the intact network (library.nodesRemovalProcedure and
+# library.edgesRemovalProcedure). The graph is converted once into a CSRGraph; the removed nodes and edges are masked by
+# giving their edges a zero weight (a thief never samples an edge with a zero weight), and after each batch a short GOT run
+# is made only on the connected components touched by the batch, the other components keeping their scores.
+# The scores of runs with different lengths are compared as rates: (noVDiamonds - meanVDiamonds) / epochs for the nodes and
+# meanPassesEdges / epochs for the edges (higher is more central for both).
+
+import copy
+import numpy as np
+import GraphAdapter
+import Convergence
+import History
+import ThiefRandom
+import VectorizedGOT
+import library
+
+def maskedGraph(G):
+    # Output:
+    #   a CSRGraph of G with its own copy of the weights, which can be masked without changing G
+    csr = copy.copy(GraphAdapter.GraphAdapter(G, 0).csr)
+    csr.weights = np.array(csr.weights, dtype=np.float64)
+    return csr
+
+def maskEdges(csr, edgeIds):
+    # remove the edges edgeIds from the neighbour sampling
+    csr.weights[edgeIds] = 0
+    csr.buildCumulativeWeights()
+
+def estimateRates(csr, nodes, noThiefs, noVDiamonds, noEpochs, seed):
+    # a GOT run of noEpochs epochs with thieves only in the given nodes (whole connected components of the masked graph)
+    # Output:
+    #   nodeRates, edgeRates - the centrality rates of all nodes and edges (only the ones of the components of nodes are meaningful)
+    graph = GraphAdapter.GraphAdapter(csr, noVDiamonds)
+    thieves = VectorizedGOT.ThiefPopulation(np.repeat(nodes, noThiefs), csr.indexType)
+    history = History.EpochHistory(csr.noNodes, csr.noEdges, noEpochs, 'mean')
+    convergence = Convergence.createCheck(csr.noNodes, 10, 1, None)
+    parameters = {'noEpochs': noEpochs, 'untilConvergence': False, 'topK': 0, 'checkpointEvery': 0, 'checkpointSeconds': 0}
+    result = VectorizedGOT.runEpochs(graph, thieves, history, convergence, ThiefRandom.ThiefRandom(seed), 0, parameters, False, None)
+    return [(noVDiamonds - result.nodeScores) / result.k, result.edgeScores / result.k]
+
+def adaptiveOrder(csr, kind, noThiefs, noVDiamonds, noEpochs, batchFraction, reEpochs, seed):
+    # Output:
+    #   the node indices (kind='nodes') or the edge indices (kind='edges') in the order of the adaptive attack
+    noItems = csr.noNodes if kind == 'nodes' else csr.noEdges
+    batchSize = max(int(round(batchFraction * noItems)), 1)
+    if (reEpochs is None):
+        reEpochs = max(noEpochs // 5, 10)
+    alive = np.ones(noItems, dtype=bool)
+    aliveEdges = csr.weights > 0
+
+    # the first estimate is a full run on the whole network
+    step = 0
+    [nodeRates, edgeRates] = estimateRates(csr, np.flatnonzero(csr.rowTotal > 0), noThiefs, noVDiamonds, noEpochs, seed)
+    order = []
+    while (alive.any()):
+        # remove the most central batch (by the current rates)
+        rates = nodeRates if kind == 'nodes' else edgeRates
+        candidates = np.flatnonzero(alive)
+        if (candidates.shape[0] > batchSize):
+            candidates = candidates[np.argpartition(-rates[candidates], batchSize - 1)[:batchSize]]
+        batch = candidates[np.argsort(-rates[candidates], kind='mergesort')]
+        order.append(batch)
+        alive[batch] = False
+        if (kind == 'nodes'):
+            removedEdges = np.unique(csr.arcEdges[np.concatenate([np.arange(csr.indptr[v], csr.indptr[v + 1]) for v in batch])])
+        else:
+            removedEdges = batch
+        removedEdges = removedEdges[aliveEdges[removedEdges]]
+        if (removedEdges.shape[0] == 0):
+            continue
+        aliveEdges[removedEdges] = False
+        maskEdges(csr, removedEdges)
+        if (not alive.any() or not aliveEdges.any()):
+            continue
+
+        # estimate again the components touched by the batch
+        step += 1
+        labels = library.componentLabels(csr.noNodes, csr.edges[aliveEdges])
+        touched = np.unique(labels[csr.edges[removedEdges].ravel()])
+        nodes = np.flatnonzero(np.isin(labels, touched) & (csr.rowTotal > 0))
+        if (nodes.shape[0] == 0):
+            continue
+        [newNodeRates, newEdgeRates] = estimateRates(csr, nodes, noThiefs, noVDiamonds, reEpochs, None if seed is None else seed + step)
+        affectedEdges = aliveEdges & np.isin(labels[csr.edges[:, 0]], touched)
+        nodeRates[nodes] = newNodeRates[nodes]
+        nodeRates[np.isin(labels, touched) & (csr.rowTotal == 0)] = 0
+        edgeRates[affectedEdges] = newEdgeRates[affectedEdges]
+    return np.concatenate(order)
+
+
+def nodesRemovalProcedure(G, noThiefs, noVDiamonds, noEpochs, batchFraction=0.05, reEpochs=None, seed=None):
+    # Input:
+    #   G - the network analyzed (a NetworkX graph or a CSRGraph)
+    #   noThiefs, noVDiamonds, noEpochs - the GOT parameters of the first estimate (see GOT.ComputeCentrality)
+    #   batchFraction - the fraction of the nodes removed between two estimates (default 0.05)
+    #   reEpochs - the number of epochs of the estimates after each batch (default noEpochs // 5, at least 10)
+    #   seed - seed of the thieves of the first estimate; the estimate after batch b uses seed + b (default None, random)
+    # Output:
+    #   nodesGiant - an array with the remaining size of the giant component after each node removed
+    #   noComponents - an array with the remaining number of connected components after each node removed
+    #   nodesSorted - the nodes in the order of their removal
+    csr = maskedGraph(G)
+    nodesOrder = adaptiveOrder(csr, 'nodes', noThiefs, noVDiamonds, noEpochs, batchFraction, reEpochs, seed)
+    neighbours = [csr.indices[csr.indptr[v]:csr.indptr[v + 1]].tolist() for v in range(csr.noNodes)]
+    [nodesGiant, noComponents] = library.nodesRemovalCurves(neighbours, nodesOrder.tolist())
+    return [nodesGiant, noComponents, csr.toLabels(nodesOrder)]
+
+def edgesRemovalProcedure(G, noThiefs, noVDiamonds, noEpochs, batchFraction=0.05, reEpochs=None, seed=None):
+    # Input:
+    #   the same as for nodesRemovalProcedure (batchFraction is a fraction of the edges)
+    # Output:
+    #   nodesGiant - an array with the remaining size of the giant component after each edge removed
+    #   noComponents - an array with the remaining number of connected components after each edge removed
+    #   edgesSorted - the edges in the order of their removal, in the format of the GOT sortedEdges
+    csr = maskedGraph(G)
+    edgesOrder = adaptiveOrder(csr, 'edges', noThiefs, noVDiamonds, noEpochs, batchFraction, reEpochs, seed)
+    [nodesGiant, noComponents] = library.edgesRemovalCurves(csr.noNodes, csr.edges[edgesOrder].tolist())
+    return [nodesGiant, noComponents, csr.rankedEdges(edgesOrder)]
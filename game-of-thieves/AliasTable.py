@@ -0,0 +1,88 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+class AliasTable:
+    # Walker alias table which chooses a neighbour of a node proportionally to the edges 'value' in O(1)
+    def __init__(self, neighbours, weights):
+        n = len(neighbours)
+        sumWeights = float(sum(weights))
+        self.neighbours = neighbours
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+
+        # Vose's method: split the scaled probabilities in under-full and over-full columns and pair them
+        scaled = [w * n / sumWeights for w in weights]
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+        while (small and large):
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            if (scaled[l] < 1.0):
+                small.append(l)
+            else:
+                large.append(l)
+
+    def sample(self, rdProb):
+        # Input:
+        #   rdProb - a uniform random number in [0,1)
+        # Output:
+        #   the chosen neighbour
+        x = rdProb * len(self.neighbours)
+        i = int(x)
+        if (i >= len(self.neighbours)):
+            i = len(self.neighbours) - 1
+        if (x - i < self.prob[i]):
+            return self.neighbours[i]
+        return self.neighbours[self.alias[i]]
+
+
+class AliasTables:
+    # the alias tables of the nodes of one GOT run, built from its CSRGraph the first time a thief leaves a node
+    # The tables belong to the GraphAdapter of the run (every ComputeCentrality call converts the graph again), so a graph
+    # changed between two runs is never sampled with old tables; invalidate and setEdgeValue are only for changes made while
+    # the run goes on.
+    def __init__(self, csr):
+        self.csr = csr
+        self.tables = {}
+
+    def get(self, node):
+        # Output:
+        #   the alias table of the node index node (its neighbours are node indices)
+        try:
+            return self.tables[node]
+        except KeyError:
+            arcs = slice(self.csr.indptr[node], self.csr.indptr[node + 1])
+            table = AliasTable(self.csr.indices[arcs].tolist(), self.csr.weights[self.csr.arcEdges[arcs]].tolist())
+            self.tables[node] = table
+            return table
+
+    def invalidate(self, nodes=None):
+        # drop the alias tables of the given node indices (or of all nodes if nodes is None)
+        if (nodes is None):
+            self.tables.clear()
+            return
+        for node in nodes:
+            self.tables.pop(node, None)
+
+    def setEdgeValue(self, edgeId, value):
+        # change the 'value' of the edge edgeId of the CSRGraph and invalidate only the alias tables of its endpoints
+        self.csr.weights[edgeId] = value
+        self.csr.buildCumulativeWeights()
+        self.invalidate(self.csr.edges[edgeId].tolist())
@@ -0,0 +1,174 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+import os
+import numpy as np
+
+class CSRGraph:
+    # compact (CSR) representation of an undirected weighted graph, built once and shared by the fast GOT engines
+    #   noNodes, noEdges - size of the graph
+    #   edges - (noEdges, 2) array with the endpoints of every edge (in the order of G.edges())
+    #   weights - the 'value' of every edge
+    #   indptr, indices - CSR adjacency; the neighbours of node v are indices[indptr[v]:indptr[v+1]]
+    #   arcEdges - the edge index of every CSR entry (arc)
+    #   cumWeights - global cumulative sum of the arc weights, used for the batched neighbour sampling
+    #   rowStart, rowTotal - cumulative weight before the first arc of each node and the total weight of its arcs
+    #   labels - the original label of every node index (None when the nodes are labeled 0..N-1, the label is the index)
+    def __init__(self, noNodes, edges, weights, labels=None):
+        self.noNodes = noNodes
+        self.labels = labels
+        self.nodeIndex = None
+        self.noEdges = edges.shape[0]
+        self.indexType = np.int32 if max(noNodes, 2 * self.noEdges) < np.iinfo(np.int32).max else np.int64
+        self.edges = np.asarray(edges, dtype=self.indexType).reshape(self.noEdges, 2)
+        self.weights = np.asarray(weights, dtype=np.float64)
+
+        # every edge gives two arcs, except the self loops which are stored only once (as NetworkX does)
+        edgeIds = np.arange(self.noEdges, dtype=self.indexType)
+        notLoop = self.edges[:, 0] != self.edges[:, 1]
+        source = np.concatenate((self.edges[:, 0], self.edges[notLoop, 1]))
+        target = np.concatenate((self.edges[:, 1], self.edges[notLoop, 0]))
+        arcEdges = np.concatenate((edgeIds, edgeIds[notLoop]))
+        order = np.argsort(source, kind='mergesort')
+        self.indices = target[order]
+        self.arcEdges = arcEdges[order]
+        self.indptr = np.zeros(noNodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(source, minlength=noNodes), out=self.indptr[1:])
+        self.degrees = np.diff(self.indptr)
+
+        self.buildCumulativeWeights()
+
+    def buildCumulativeWeights(self):
+        # precompute the cumulative edge-weight tables (has to be called again if the weights are changed)
+        cumBefore = np.zeros(self.indices.shape[0] + 1)
+        np.cumsum(self.weights[self.arcEdges], out=cumBefore[1:])
+        self.cumWeights = cumBefore[1:]
+        self.rowStart = cumBefore[self.indptr[:-1]]
+        self.rowTotal = cumBefore[self.indptr[1:]] - self.rowStart
+
+    def toLabels(self, nodes):
+        # Output:
+        #   the labels of the node indices nodes (an array of any shape)
+        if (self.labels is None):
+            return nodes
+        return self.labels[nodes]
+
+    def indexOf(self, label):
+        # Output:
+        #   the index of the node with the given label (the label to index map is built the first time it is needed)
+        if (self.labels is None):
+            return label
+        if (self.nodeIndex is None):
+            self.nodeIndex = dict(zip(self.labels.tolist(), range(self.noNodes)))
+        return self.nodeIndex[label]
+
+    def rankedEdges(self, edgeIds):
+        # Output:
+        #   (len(edgeIds), 1, 2) array with the endpoints of the edges edgeIds, the format of the GOT sortedEdges (float64
+        #   node indices when the nodes are labeled 0..N-1, the node labels otherwise)
+        if (self.labels is None):
+            return self.edges[edgeIds].reshape(len(edgeIds), 1, 2).astype(np.float64)
+        return self.labels[self.edges[edgeIds]].reshape(len(edgeIds), 1, 2)
+
+    def sampleNeighbours(self, nodes, rdProb):
+        # Input:
+        #   nodes - array with the current node of each walker (all of them must have at least one neighbour)
+        #   rdProb - array with one uniform random number in [0,1) per walker
+        # Output:
+        #   moveTo - the neighbour chosen by each walker, proportionally to the edges 'value'
+        #   edgeIds - the index of the edge used by each walker
+        target = self.rowStart[nodes] + (1.0 - rdProb) * self.rowTotal[nodes]
+        arcs = np.searchsorted(self.cumWeights, target, side='left')
+        arcs = np.clip(arcs, self.indptr[nodes], self.indptr[nodes + 1] - 1)
+        return [self.indices[arcs], self.arcEdges[arcs]]
+
+
+def fromNetworkX(G):
+    # Input:
+    #   G - a NetworkX graph with a 'value' attribute on each edge
+    # Output:
+    #   csr - the compact representation of G; if the nodes of G are exactly 0..N-1 the node index is the label, otherwise
+    #         the nodes are indexed in the order of G.nodes() and csr.labels keeps their labels
+    noNodes = G.number_of_nodes()
+    noEdges = G.number_of_edges()
+    labels = None
+    nodeIndex = None
+    nodes = list(G)
+    if (set(nodes) != set(range(noNodes))):
+        labels = np.fromiter(nodes, dtype=object, count=noNodes)
+        nodeIndex = dict(zip(nodes, range(noNodes)))
+    edges = np.zeros((noEdges, 2), dtype=np.int64)
+    weights = np.ones(noEdges)
+    i = 0
+    for edge in G.edges(data='value', default=1):
+        if (nodeIndex is None):
+            edges[i, 0] = edge[0]
+            edges[i, 1] = edge[1]
+        else:
+            edges[i, 0] = nodeIndex[edge[0]]
+            edges[i, 1] = nodeIndex[edge[1]]
+        weights[i] = edge[2]
+        i += 1
+    csr = CSRGraph(noNodes, edges, weights, labels)
+    csr.nodeIndex = nodeIndex
+    return csr
+
+csrArrays = ['edges', 'weights', 'indptr', 'indices', 'arcEdges', 'cumWeights']
+
+def save(csr, directory):
+    # write the arrays of csr in directory, one .npy file per array (they can be opened memory-mapped with load)
+    if (not os.path.isdir(directory)):
+        os.makedirs(directory)
+    for name in csrArrays:
+        np.save(os.path.join(directory, name + '.npy'), getattr(csr, name))
+    if (csr.labels is not None):
+        np.save(os.path.join(directory, 'labels.npy'), csr.labels, allow_pickle=csr.labels.dtype == object)
+
+def load(directory, mmapMode='r'):
+    # Input:
+    #   directory - a directory written by save or by EdgeListLoader.loadEdgeList (with the node labels in labels.npy, if any)
+    #   mmapMode - how the arrays are opened (default 'r', memory-mapped read only; None loads them in memory)
+    # Output:
+    #   csr - the CSRGraph; only the per node arrays (degrees, rowStart, rowTotal) are built in memory
+    arrays = {}
+    for name in csrArrays:
+        arrays[name] = np.load(os.path.join(directory, name + '.npy'), mmap_mode=mmapMode)
+    csr = CSRGraph.__new__(CSRGraph)
+    csr.noNodes = arrays['indptr'].shape[0] - 1
+    csr.noEdges = arrays['edges'].shape[0]
+    csr.indexType = arrays['edges'].dtype.type
+    for name in csrArrays:
+        setattr(csr, name, arrays[name])
+    csr.labels = None
+    csr.nodeIndex = None
+    labelsFile = os.path.join(directory, 'labels.npy')
+    if (os.path.exists(labelsFile)):
+        try:
+            labels = np.load(labelsFile, mmap_mode=mmapMode)
+        except ValueError:
+            # labels of mixed types are stored as Python objects, which cannot be memory-mapped
+            labels = np.load(labelsFile, allow_pickle=True)
+        if (labels.dtype.kind not in 'iu' or not np.array_equal(labels, np.arange(csr.noNodes))):
+            csr.labels = labels
+    csr.indptr = np.array(csr.indptr)
+    csr.degrees = np.diff(csr.indptr)
+    cumBefore = np.zeros(csr.noNodes + 1)
+    nonEmpty = csr.indptr > 0
+    cumBefore[nonEmpty] = csr.cumWeights[csr.indptr[nonEmpty] - 1]
+    csr.rowStart = cumBefore[:-1]
+    csr.rowTotal = cumBefore[1:] - cumBefore[:-1]
+    return csr
@@ -0,0 +1,112 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+# Checkpoints of a GOT run: the whole state of the run (a flat dict of NumPy arrays and scalars) is stored in one .npz file.
+# A checkpoint is first written in checkpointFile + '.tmp' and then renamed, so checkpointFile always holds a complete state.
+
+import os
+import time
+import zlib
+import threading
+import numpy as np
+
+def save(checkpointFile, state):
+    # write the state (a dict of arrays and scalars) in checkpointFile
+    with open(checkpointFile + '.tmp', 'wb') as f:
+        np.savez(f, **state)
+    os.replace(checkpointFile + '.tmp', checkpointFile)
+
+def load(checkpointFile):
+    # Output:
+    #   the state stored in checkpointFile (the 0-d arrays are converted back to Python scalars)
+    with np.load(checkpointFile, allow_pickle=False) as data:
+        state = {}
+        for name in data.files:
+            value = data[name]
+            state[name] = value.item() if value.ndim == 0 else value
+    return state
+
+def withPrefix(prefix, state):
+    return dict((prefix + name, value) for name, value in state.items())
+
+def stripPrefix(prefix, state):
+    return dict((name[len(prefix):], value) for name, value in state.items() if name.startswith(prefix))
+
+def graphFingerprint(csr):
+    # a checksum of the edges of the graph, to check that a run is resumed on the graph on which it was started
+    return zlib.crc32(np.ascontiguousarray(csr.edges).view(np.uint8)) ^ zlib.crc32(np.ascontiguousarray(csr.weights).view(np.uint8))
+
+class CheckpointWriter:
+    # writes the checkpoints of a run every everyEpochs epochs and/or every everySeconds seconds
+    # The state is copied in the epoch loop (the arrays may change afterwards) and written by a background thread, so the
+    # loop does not wait for the disk; if a new checkpoint is due while the previous one is still written, only the newest
+    # pending state is kept.
+    def __init__(self, checkpointFile, everyEpochs=None, everySeconds=None):
+        if (everyEpochs is None and everySeconds is None):
+            raise ValueError("a checkpoint needs everyEpochs and/or everySeconds")
+        self.checkpointFile = checkpointFile
+        self.everyEpochs = everyEpochs
+        self.everySeconds = everySeconds
+        self.lastTime = time.time()
+        self.pending = None
+        self.closed = False
+        self.error = None
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.writeLoop)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def due(self, k):
+        # Output:
+        #   True if a checkpoint has to be taken at the end of epoch k
+        if (self.everyEpochs is not None and k % self.everyEpochs == 0):
+            return True
+        return self.everySeconds is not None and time.time() - self.lastTime >= self.everySeconds
+
+    def submit(self, state):
+        # hand a copy of the state to the background thread
+        self.lastTime = time.time()
+        with self.condition:
+            if (self.error is not None):
+                raise self.error
+            self.pending = state
+            self.condition.notify()
+
+    def writeLoop(self):
+        while (True):
+            with self.condition:
+                while (self.pending is None and not self.closed):
+                    self.condition.wait()
+                if (self.pending is None):
+                    return
+                state = self.pending
+                self.pending = None
+            try:
+                save(self.checkpointFile, state)
+            except Exception as error:
+                with self.condition:
+                    self.error = error
+                return
+
+    def close(self):
+        # wait until the last pending checkpoint is written
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+        self.thread.join()
+        if (self.error is not None):
+            raise self.error
@@ -0,0 +1,191 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+# Comparison pipeline of GOT with the betweenness centrality: GOT, the baseline and the nodes and edges removal procedures are
+# run as separate stages, each one timed. The baseline is the source-sampled (k-pivot) betweenness: the shortest paths are
+# computed only from noPivots random sources (all nodes if noPivots is None), spread over a pool of processes, and the
+# accumulated dependencies are scaled by N / noPivots. The rankings are integer arrays (node indices, or (M,2) arrays of
+# edge endpoints; node labels if the nodes are not labeled 0..N-1) which the removal procedures of library take as they are.
+
+import multiprocessing
+import time
+import numpy as np
+import networkx as nx
+import CSRGraph
+import library
+
+# the GOT engines of the pipeline
+gotEngines = ['GOT', 'VectorizedGOT', 'ParallelGOT', 'approximate']
+
+# state of the worker processes of sampledBetweenness
+betweennessWorkerState = {}
+
+def initBetweennessWorker(G, nodesWeight, edgesWeight):
+    betweennessWorkerState['G'] = G
+    betweennessWorkerState['nodesWeight'] = nodesWeight
+    betweennessWorkerState['edgesWeight'] = edgesWeight
+    index = dict(zip(G.nodes(), range(G.number_of_nodes())))
+    betweennessWorkerState['index'] = index
+    betweennessWorkerState['ends'] = np.array([[index[u], index[v]] for u, v in G.edges()], dtype=np.int64).reshape(-1, 2)
+    # the connected component of every node (only used for the undirected graphs)
+    component = np.zeros(G.number_of_nodes(), dtype=np.int64)
+    if (not G.is_directed()):
+        for i, nodes in enumerate(nx.connected_components(G)):
+            component[[index[node] for node in nodes]] = i
+    betweennessWorkerState['component'] = component
+
+def betweennessFromSources(sources):
+    # Output:
+    #   the node and edge betweenness dependencies accumulated from the given sources (arrays in the order of G.nodes() and G.edges())
+    G = betweennessWorkerState['G']
+    N = G.number_of_nodes()
+    edges = nx.edge_betweenness_centrality_subset(G, sources, list(G), normalized=False, weight=betweennessWorkerState['edgesWeight'])
+    edgesBetweenness = np.fromiter((edges[edge] for edge in G.edges()), dtype=np.float64, count=len(edges))
+    if (betweennessWorkerState['nodesWeight'] != betweennessWorkerState['edgesWeight'] or G.is_directed()):
+        nodes = nx.betweenness_centrality_subset(G, sources, list(G), normalized=False, weight=betweennessWorkerState['nodesWeight'])
+        return [np.fromiter((nodes[node] for node in G), dtype=np.float64, count=N), edgesBetweenness]
+
+    # with the same shortest paths the node betweenness follows from the edge betweenness: the dependencies on the edges of
+    # a node count twice every path through the node, plus once every path which starts or ends in it (the (undirected)
+    # betweenness is halved, as NetworkX does); a source reaches only the other nodes of its connected component
+    ends = betweennessWorkerState['ends']
+    component = betweennessWorkerState['component']
+    incident = np.bincount(ends[:, 0], edgesBetweenness, minlength=N) + np.bincount(ends[:, 1], edgesBetweenness, minlength=N)
+    isSource = np.zeros(N)
+    isSource[[betweennessWorkerState['index'][source] for source in set(sources)]] = 1
+    componentSize = np.bincount(component)[component]
+    componentSources = np.bincount(component, isSource)[component]
+    endpointPaths = 0.5 * ((componentSize - 1) * isSource + componentSources - isSource)
+    return [(incident - endpointPaths) / 2, edgesBetweenness]
+
+def hopsIfUniform(G, weight):
+    # Output:
+    #   None if all edges of G have the same weight (or none of them has it), weight otherwise
+    if (weight is None):
+        return None
+    values = set(nx.get_edge_attributes(G, weight).values())
+    if (len(values) == 0 or (len(values) == 1 and len(nx.get_edge_attributes(G, weight)) == G.number_of_edges())):
+        return None
+    return weight
+
+def sampledBetweenness(G, noPivots=None, noProcesses=1, nodesWeight=None, edgesWeight='value', seed=None):
+    # Input:
+    #   G - the network analyzed
+    #   noPivots - number of sampled sources (default None, all nodes: the exact betweenness)
+    #   noProcesses - number of processes over which the sources are spread (default 1, in the current process)
+    #   nodesWeight, edgesWeight - the edge attribute used as distance for the nodes and for the edges betweenness (None for
+    #                              hops; default as in example_GOT_random_networks.py, hops for the nodes and 'value' for the edges)
+    #   seed - seed of the sampling of the sources (default None, the global np.random)
+    # Output:
+    #   nodesBetweenness - the estimated betweenness of every node (in the order of G.nodes())
+    #   edgesBetweenness - the estimated betweenness of every edge (in the order of G.edges())
+    # with equal weights the shortest paths are the ones in hops, which a BFS finds faster than Dijkstra's algorithm
+    nodesWeight = hopsIfUniform(G, nodesWeight)
+    edgesWeight = hopsIfUniform(G, edgesWeight)
+    nodes = list(G)
+    if (noPivots is None or noPivots >= len(nodes)):
+        pivots = nodes
+    else:
+        pivots = [nodes[i] for i in library.randomState(seed).choice(len(nodes), noPivots, replace=False)]
+    chunks = [chunk.tolist() for chunk in np.array_split(np.arange(len(pivots)), min(len(pivots), 4 * max(noProcesses, 1))) if chunk.shape[0] > 0]
+    chunks = [[pivots[i] for i in chunk] for chunk in chunks]
+
+    initBetweennessWorker(G, nodesWeight, edgesWeight)
+    if (noProcesses > 1 and len(chunks) > 1):
+        pool = multiprocessing.Pool(min(noProcesses, len(chunks)), initBetweennessWorker, (G, nodesWeight, edgesWeight))
+        try:
+            parts = pool.map(betweennessFromSources, chunks)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        parts = [betweennessFromSources(chunk) for chunk in chunks]
+
+    scale = float(len(nodes)) / max(len(pivots), 1)
+    return [scale * np.sum([part[0] for part in parts], axis=0), scale * np.sum([part[1] for part in parts], axis=0)]
+
+
+def runGOT(G, gotEngine, noThiefs, noVDiamonds, noEpochs, gotOptions):
+    if (gotEngine not in gotEngines):
+        raise ValueError("unknown GOT engine " + str(gotEngine) + ", it has to be one of " + str(gotEngines))
+    options = dict(gotOptions or {})
+    if (gotEngine == 'GOT' or gotEngine == 'approximate'):
+        import GOT
+        return GOT.ComputeCentrality(G, noThiefs, noVDiamonds, noEpochs, approximate=(gotEngine == 'approximate'), **options)
+    if (gotEngine == 'ParallelGOT'):
+        import ParallelGOT
+        return ParallelGOT.ComputeCentrality(G, noThiefs, noVDiamonds, noEpochs, **options)
+    import VectorizedGOT
+    return VectorizedGOT.ComputeCentrality(G, noThiefs, noVDiamonds, noEpochs, **options)
+
+def compareCentralities(G, noThiefs, noVDiamonds, noEpochs, noPivots=None, noProcesses=1, gotEngine='VectorizedGOT', gotOptions=None,
+                        nodesWeight=None, edgesWeight='value', removal=True, seed=None):
+    # Input:
+    #   G - the network analyzed
+    #   noThiefs, noVDiamonds, noEpochs - the GOT parameters (see GOT.ComputeCentrality)
+    #   noPivots, noProcesses, nodesWeight, edgesWeight - the betweenness parameters (see sampledBetweenness); noProcesses is
+    #                                                     also used by the removal procedures
+    #   gotEngine - one of gotEngines (default 'VectorizedGOT')
+    #   gotOptions - a dict with the other parameters of the GOT engine (e.g. {'historyMode': 'mean', 'untilConvergence': True})
+    #   removal - if False the removal procedures are not run (default True)
+    #   seed - seed of the GOT thieves (if not in gotOptions) and of the betweenness sources (default None)
+    # Output:
+    #   a dict with:
+    #     'timings' - the seconds of each stage: 'GOT', 'betweenness', 'nodesRemoval', 'edgesRemoval'
+    #     'got' - the GOTResult
+    #     'betweenness' - [nodesBetweenness, edgesBetweenness] (see sampledBetweenness)
+    #     'nodesRankings', 'edgesRankings' - {'GOT': ranking, 'betweenness': ranking}, from the most central to the least central
+    #     'nodesRemoval', 'edgesRemoval' - the library.evaluateRankings results of [GOT, betweenness] (if removal is True)
+    csr = CSRGraph.fromNetworkX(G)
+    gotOptions = dict(gotOptions or {})
+    if (seed is not None and gotEngine != 'approximate'):
+        gotOptions.setdefault('seed', seed)
+    timings = {}
+
+    t = time.perf_counter()
+    got = runGOT(G, gotEngine, noThiefs, noVDiamonds, noEpochs, gotOptions)
+    timings['GOT'] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    [nodesBetweenness, edgesBetweenness] = sampledBetweenness(G, noPivots, noProcesses, nodesWeight, edgesWeight, seed)
+    timings['betweenness'] = time.perf_counter() - t
+
+    result = {'timings': timings, 'got': got, 'betweenness': [nodesBetweenness, edgesBetweenness]}
+    result['nodesRankings'] = {'GOT': csr.toLabels(got.nodeScores.argsort(axis=0, kind='mergesort')),
+                               'betweenness': csr.toLabels((-nodesBetweenness).argsort(kind='mergesort'))}
+    result['edgesRankings'] = {'GOT': csr.toLabels(csr.edges[got.sortedEdgesIndex]),
+                               'betweenness': csr.toLabels(csr.edges[(-edgesBetweenness).argsort(kind='mergesort')])}
+
+    if (removal):
+        for kind in ['nodes', 'edges']:
+            t = time.perf_counter()
+            rankings = result[kind + 'Rankings']
+            result[kind + 'Removal'] = library.evaluateRankings(G, [rankings['GOT'], rankings['betweenness']], kind, noProcesses)
+            timings[kind + 'Removal'] = time.perf_counter() - t
+    return result
+
+def report(comparison):
+    # Output:
+    #   the lines of a text report of a comparison: the time of each stage and the areas under the removal curves
+    lines = ["%-14s %10.3f s" % (stage, seconds) for stage, seconds in comparison['timings'].items()]
+    for kind in ['nodes', 'edges']:
+        if ((kind + 'Removal') in comparison):
+            removal = comparison[kind + 'Removal']
+            for i, name in enumerate(['GOT', 'betweenness']):
+                lines.append("%s removal, %-12s AUC giant component (smaller is better) %12.0f, AUC number of components (higher is better) %12.0f"
+                             % (kind, name + ':', removal['aucGiant'][i], removal['aucComponents'][i]))
+    return lines
@@ -0,0 +1,119 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+import numpy as np
+
+class ConvergenceCheck:
+    # the GOT stopping criteria: the mean Euclidean distance between the nodes ranks of consecutive checks, over the last
+    # noLastEuclidDists checks, has to be smaller than 2% of the number of nodes
+    # It keeps a running sum of the vdiamonds instead of the whole history (the ranks of the sums are the ranks of the means),
+    # and sorts the nodes starting from their previous order, which is almost sorted, with a stable (adaptive) sort; the sort
+    # is skipped when the previous order still holds. A check costs about a quarter of a vectorized epoch, hence the larger
+    # stride of the fast engines.
+    # Input:
+    #   noNodes - number of nodes
+    #   noLastEuclidDists - for how many consecutive checks the stopping criteria is checked (default 10)
+    #   stride - the criteria is checked every stride epochs (default 1, at each epoch)
+    def __init__(self, noNodes, noLastEuclidDists=10, stride=1):
+        self.noNodes = noNodes
+        self.noLastEuclidDists = noLastEuclidDists
+        self.stride = stride
+        self.k = 0
+        self.sumVDiamonds = np.zeros(noNodes)
+        self.sortedNodes = np.arange(noNodes)
+        self.nodesRank = np.zeros(noNodes)
+        self.lastEuclidDists = noNodes + np.zeros(noLastEuclidDists)
+        self.euclidDist = float(noNodes)
+
+    def update(self, vdiamonds):
+        # Input:
+        #   vdiamonds - the amount of vdiamonds per node at the current epoch
+        # Output:
+        #   True if the stopping criteria is fulfilled
+        self.sumVDiamonds += vdiamonds
+        self.k += 1
+        if (self.k % self.stride != 0):
+            return False
+
+        sums = self.sumVDiamonds[self.sortedNodes]
+        if (self.k != self.stride and np.all(sums[1:] >= sums[:-1])):
+            # the order of the previous check still holds: the ranks did not change (the first check always ranks the nodes)
+            self.euclidDist = 0.0
+        else:
+            order = np.argsort(sums, kind='mergesort')
+            self.sortedNodes = self.sortedNodes[order]
+            nodesRank = np.empty(self.noNodes)
+            nodesRank[self.sortedNodes] = np.arange(self.noNodes)
+            diff = nodesRank - self.nodesRank
+            self.euclidDist = np.sqrt(np.dot(diff, diff))
+            self.nodesRank = nodesRank
+        self.lastEuclidDists[:-1] = self.lastEuclidDists[1:]
+        self.lastEuclidDists[-1] = self.euclidDist
+        return np.mean(self.lastEuclidDists) < 0.02 * self.noNodes
+
+    def getState(self):
+        # Output:
+        #   a copy of the state of the check (for the checkpoints)
+        return {'k': self.k, 'sumVDiamonds': self.sumVDiamonds.copy(), 'sortedNodes': self.sortedNodes.copy(),
+                'nodesRank': self.nodesRank.copy(), 'lastEuclidDists': self.lastEuclidDists.copy(), 'euclidDist': self.euclidDist}
+
+    def setState(self, state):
+        if (state['lastEuclidDists'].shape[0] != self.noLastEuclidDists):
+            raise ValueError("the stored convergence window does not match noLastEuclidDists")
+        self.k = state['k']
+        self.sumVDiamonds[:] = state['sumVDiamonds']
+        self.sortedNodes = state['sortedNodes'].copy()
+        self.nodesRank = state['nodesRank'].copy()
+        self.lastEuclidDists = state['lastEuclidDists'].copy()
+        self.euclidDist = state['euclidDist']
+
+
+class TopKConvergenceCheck(ConvergenceCheck):
+    # the stopping criteria of the top-k mode: only the k most central nodes (the ones with the fewest mean vdiamonds) are
+    # followed, with a partial selection at each check; GOT stops when their set and their order did not change for
+    # noLastEuclidDists consecutive checks
+    # euclidDist is the Euclidean distance between the current positions of the top k nodes and their positions at the
+    # previous check (k for a node which was not in the top), so it is 0 only if the top is unchanged
+    def __init__(self, noNodes, topK, noLastEuclidDists=10, stride=1):
+        ConvergenceCheck.__init__(self, noNodes, noLastEuclidDists, stride)
+        self.topK = min(topK, noNodes)
+        self.sortedNodes = np.zeros(0, dtype=np.int64)
+
+    def update(self, vdiamonds):
+        self.sumVDiamonds += vdiamonds
+        self.k += 1
+        if (self.k % self.stride != 0 or self.topK == 0):
+            return False
+
+        top = np.sort(np.argpartition(self.sumVDiamonds, self.topK - 1)[:self.topK])
+        top = top[np.argsort(self.sumVDiamonds[top], kind='mergesort')]
+        previousRank = np.zeros(self.noNodes) + self.topK
+        previousRank[self.sortedNodes] = np.arange(self.sortedNodes.shape[0])
+        diff = previousRank[top] - np.arange(self.topK)
+        self.euclidDist = np.sqrt(np.dot(diff, diff))
+        self.lastEuclidDists[:-1] = self.lastEuclidDists[1:]
+        self.lastEuclidDists[-1] = self.euclidDist
+        self.sortedNodes = top
+        return bool(np.all(self.lastEuclidDists == 0))
+
+
+def createCheck(noNodes, noLastEuclidDists=10, stride=1, topK=None):
+    # Output:
+    #   the stopping criteria of a GOT run: on all nodes, or on the topK most central ones if topK is given
+    if (topK):
+        return TopKConvergenceCheck(noNodes, topK, noLastEuclidDists, stride)
+    return ConvergenceCheck(noNodes, noLastEuclidDists, stride)
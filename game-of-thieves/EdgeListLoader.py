@@ -0,0 +1,210 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+# Streaming loader of edge lists: the file is read in chunks, the node ids are relabeled to dense indices 0..N-1 (in the
+# order in which they first appear, u before v, as nx.read_edgelist adds them) and the CSR arrays are written in memory-mapped .npy files (see CSRGraph.save), so a large
+# network is given to the GOT engines without ever building a NetworkX graph.
+# Apart from the memory maps, the memory used is one entry per distinct node id and, if the duplicates are removed, up to
+# four 8 bytes integers per edge.
+
+import os
+import itertools
+import numpy as np
+import CSRGraph
+
+def loadEdgeList(edgeListFile, csrDirectory, weighted=False, binary=False, labelType=np.int64, delimiter=None, comments='#',
+                 chunkSize=1000000, removeDuplicates=True):
+    # Input:
+    #   edgeListFile - a text file with one edge "u v" or "u v value" per line, or a binary file of (u, v) or (u, v, value)
+    #                  records (u and v of labelType, value as float64)
+    #   csrDirectory - the directory where the CSR arrays and the node labels (labels.npy) are written
+    #   weighted - if True the third column is the 'value' of the edge (default False, all values are 1)
+    #   binary - if True edgeListFile is a binary file (default False, text)
+    #   labelType - the type of the node ids (default np.int64; str keeps the text ids as they are)
+    #   delimiter, comments - the column separator (default None, any whitespace) and the prefix of the comment lines of a text file
+    #   chunkSize - number of edges read at once
+    #   removeDuplicates - if True the repeated edges (in any direction) are merged as NetworkX does, keeping the last value,
+    #                      and the nodes and edges are in the order of the NetworkX graph of the file (nx.read_edgelist), so
+    #                      the GOT runs on both are the same (default True; otherwise the edges stay in the order of the file)
+    # Output:
+    #   csr - the CSRGraph opened on the memory-mapped files
+    #   labels - the memory-mapped array with the original id of every node index
+    if (not os.path.isdir(csrDirectory)):
+        os.makedirs(csrDirectory)
+    endsFile = os.path.join(csrDirectory, 'edges.tmp')
+    weightsFile = os.path.join(csrDirectory, 'weights.tmp')
+
+    # first pass: relabel the nodes and append the dense edges to temporary files
+    labelIndex = {}
+    noRows = 0
+    with open(endsFile, 'wb') as ends, open(weightsFile, 'wb') as values:
+        for [u, v, w] in readChunks(edgeListFile, weighted, binary, labelType, delimiter, comments, chunkSize):
+            # the new ids get indices in the order of their first appearance (u then v, line by line), as in nx.read_edgelist
+            [uniqueLabels, firstIndex, inverse] = np.unique(np.stack((u, v), axis=1).ravel(), return_index=True, return_inverse=True)
+            byAppearance = np.argsort(firstIndex, kind='mergesort')
+            ids = np.empty(uniqueLabels.shape[0], dtype=np.int64)
+            ids[byAppearance] = np.fromiter((labelIndex.setdefault(label, len(labelIndex)) for label in uniqueLabels[byAppearance].tolist()),
+                                            dtype=np.int64, count=uniqueLabels.shape[0])
+            ids[inverse.reshape(-1)].reshape(-1, 2).tofile(ends)
+            w.astype(np.float64).tofile(values)
+            noRows += u.shape[0]
+    noNodes = len(labelIndex)
+    labelDtype = labelType
+    if (labelType is str):
+        labelDtype = 'U%d' % max([len(label) for label in labelIndex] + [1])
+    labels = np.lib.format.open_memmap(os.path.join(csrDirectory, 'labels.npy'), mode='w+', dtype=labelDtype, shape=(noNodes,))
+    for start in range(0, noNodes, chunkSize):
+        labels[start:start + chunkSize] = list(itertools.islice(labelIndex, start, start + chunkSize))
+    del labelIndex
+    rawEnds = np.memmap(endsFile, dtype=np.int64, mode='r', shape=(noRows, 2)) if noRows > 0 else np.zeros((0, 2), dtype=np.int64)
+    rawWeights = np.memmap(weightsFile, dtype=np.float64, mode='r', shape=(noRows,)) if noRows > 0 else np.zeros(0)
+
+    # merge the duplicated edges: every edge keeps the position of its first occurrence and the value of the last one
+    if (removeDuplicates and noRows > 0):
+        keys = np.minimum(rawEnds[:, 0], rawEnds[:, 1]) * noNodes + np.maximum(rawEnds[:, 0], rawEnds[:, 1])
+        order = np.argsort(keys, kind='mergesort')
+        keys = keys[order]
+        groupStart = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        del keys
+        first = order[groupStart]
+        last = order[np.concatenate((groupStart[1:], [noRows])) - 1]
+        del order
+        byPosition = np.argsort(first)
+        rows = first[byPosition]
+        lastRows = last[byPosition]
+        del first, last, byPosition
+
+        # order the edges as G.edges() of the NetworkX graph of the file: by their endpoint with the smaller index, in the
+        # order in which they appear (the order of the adjacency of that endpoint), as (smaller, larger)
+        smaller = np.minimum(rawEnds[rows, 0], rawEnds[rows, 1])
+        byNode = np.argsort(smaller, kind='mergesort')
+        del smaller
+        rows = rows[byNode]
+        lastRows = lastRows[byNode]
+        del byNode
+    else:
+        rows = None
+        lastRows = None
+    noEdges = noRows if rows is None else rows.shape[0]
+    indexType = np.int32 if max(noNodes, 2 * noEdges) < np.iinfo(np.int32).max else np.int64
+
+    edges = np.lib.format.open_memmap(os.path.join(csrDirectory, 'edges.npy'), mode='w+', dtype=indexType, shape=(noEdges, 2))
+    weights = np.lib.format.open_memmap(os.path.join(csrDirectory, 'weights.npy'), mode='w+', dtype=np.float64, shape=(noEdges,))
+    for start in range(0, noEdges, chunkSize):
+        stop = min(start + chunkSize, noEdges)
+        if (rows is None):
+            edges[start:stop] = rawEnds[start:stop]
+            weights[start:stop] = rawWeights[start:stop]
+        else:
+            edges[start:stop] = np.sort(rawEnds[rows[start:stop]], axis=1)
+            weights[start:stop] = rawWeights[lastRows[start:stop]]
+    del rows, lastRows, rawEnds, rawWeights
+    os.remove(endsFile)
+    os.remove(weightsFile)
+
+    writeCSR(csrDirectory, noNodes, edges, weights, indexType, chunkSize)
+    edges.flush()
+    weights.flush()
+    return [CSRGraph.load(csrDirectory), np.load(os.path.join(csrDirectory, 'labels.npy'), mmap_mode='r')]
+
+def isDataLine(line, comments):
+    return line.strip() != '' and (comments is None or not line.lstrip().startswith(comments))
+
+def readChunks(edgeListFile, weighted, binary, labelType, delimiter, comments, chunkSize):
+    # Output:
+    #   for every chunk of the file, the arrays u, v (node ids) and w (values)
+    if (binary):
+        fields = [('u', labelType), ('v', labelType)]
+        if (weighted):
+            fields.append(('value', np.float64))
+        with open(edgeListFile, 'rb') as f:
+            while (True):
+                records = np.fromfile(f, dtype=np.dtype(fields), count=chunkSize)
+                if (records.shape[0] == 0):
+                    return
+                yield [records['u'], records['v'], records['value'] if weighted else np.ones(records.shape[0])]
+    columns = 3 if weighted else 2
+    fields = [('u', labelType), ('v', labelType)]
+    if (weighted):
+        fields.append(('value', np.float64))
+    with open(edgeListFile, 'r') as f:
+        while (True):
+            lines = list(itertools.islice(f, chunkSize))
+            if (len(lines) == 0):
+                return
+            if (not any(isDataLine(line, comments) for line in lines)):
+                # only comments and blank lines (np.loadtxt would warn about an empty input)
+                continue
+            if (labelType is not str):
+                # numeric ids are parsed by NumPy's C reader
+                records = np.loadtxt(lines, dtype=np.dtype(fields), comments=comments, delimiter=delimiter, usecols=range(columns), ndmin=1)
+                if (records.shape[0] > 0):
+                    yield [records['u'], records['v'], records['value'] if weighted else np.ones(records.shape[0])]
+                continue
+            rows = [line.split(delimiter)[:columns] for line in lines if isDataLine(line, comments)]
+            if (len(rows) == 0):
+                continue
+            table = np.array(rows)
+            if (table.ndim != 2 or table.shape[1] != columns):
+                raise ValueError("every line of " + str(edgeListFile) + " has to contain " + str(columns) + " columns")
+            w = table[:, 2].astype(np.float64) if weighted else np.ones(table.shape[0])
+            yield [table[:, 0], table[:, 1], w]
+
+def writeCSR(csrDirectory, noNodes, edges, weights, indexType, chunkSize):
+    # build the CSR arrays of the edges chunk by chunk, in the same layout as CSRGraph.CSRGraph (the arcs of a node are
+    # ordered by edge index, first those in which the node is the first endpoint, then the others)
+    noEdges = edges.shape[0]
+    degrees = np.zeros(noNodes, dtype=np.int64)
+    for start in range(0, noEdges, chunkSize):
+        chunk = np.asarray(edges[start:start + chunkSize])
+        degrees += np.bincount(chunk[:, 0], minlength=noNodes)
+        degrees += np.bincount(chunk[chunk[:, 0] != chunk[:, 1], 1], minlength=noNodes)
+    indptr = np.zeros(noNodes + 1, dtype=np.int64)
+    np.cumsum(degrees, out=indptr[1:])
+    np.save(os.path.join(csrDirectory, 'indptr.npy'), indptr)
+    noArcs = int(indptr[-1])
+    indices = np.lib.format.open_memmap(os.path.join(csrDirectory, 'indices.npy'), mode='w+', dtype=indexType, shape=(noArcs,))
+    arcEdges = np.lib.format.open_memmap(os.path.join(csrDirectory, 'arcEdges.npy'), mode='w+', dtype=indexType, shape=(noArcs,))
+
+    fill = indptr[:-1].copy()
+    for side in [0, 1]:
+        for start in range(0, noEdges, chunkSize):
+            chunk = np.asarray(edges[start:start + chunkSize])
+            edgeIds = np.arange(start, start + chunk.shape[0], dtype=indexType)
+            if (side == 1):
+                notLoop = chunk[:, 0] != chunk[:, 1]
+                chunk = chunk[notLoop]
+                edgeIds = edgeIds[notLoop]
+            source = chunk[:, side]
+            order = np.argsort(source, kind='mergesort')
+            source = source[order]
+            groupStart = np.flatnonzero(np.concatenate(([True], source[1:] != source[:-1]))) if source.shape[0] > 0 else np.zeros(0, dtype=np.int64)
+            rank = np.arange(source.shape[0]) - np.repeat(groupStart, np.diff(np.concatenate((groupStart, [source.shape[0]]))))
+            arcs = fill[source] + rank
+            indices[arcs] = chunk[order, 1 - side]
+            arcEdges[arcs] = edgeIds[order]
+            fill += np.bincount(source, minlength=noNodes)
+
+    # the cumulative arc weights, accumulated in the same order as a single np.cumsum
+    cumWeights = np.lib.format.open_memmap(os.path.join(csrDirectory, 'cumWeights.npy'), mode='w+', dtype=np.float64, shape=(noArcs,))
+    carry = 0.0
+    for start in range(0, noArcs, chunkSize):
+        stop = min(start + chunkSize, noArcs)
+        cumWeights[start:stop] = np.cumsum(np.concatenate(([carry], weights[np.asarray(arcEdges[start:stop])])))[1:]
+        carry = cumWeights[stop - 1]
+    for array in [indices, arcEdges, cumWeights]:
+        array.flush()
@@ -1,6 +1,6 @@
 # Author: Decebal Constantin Mocanu;
 # Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
-# This is a pre-alpha free software and was tested with Python 2.7.12, Matplotlib 2.1.0, Numpy 1.14, NetworkX 2.0;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
 # The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
 # For an easy understanding of the code functionality please read the following article.
 
@@ -15,16 +15,20 @@
 #  url =           {https://www.nature.com/articles/s41598-018-19356-4}
 #}
 
-import numpy as np
-import random
-import networkx as nx
 import Thief
+import GraphAdapter
+import Convergence
+import History
+import GOTResult
+import ThiefRandom
+import Progress
 
 def initializeGOTGraph(G,noNodes, noVDiamonds):
+    # kept only for API compatibility: ComputeCentrality no longer stores the game state as node and edge attributes of G
 
     #initialize the amount of vdiamonds per node
-    for i in range(noNodes):
-        G.node[i]['vdiamonds']=noVDiamonds
+    for node in G.nodes():
+        G.nodes[node]['vdiamonds']=noVDiamonds
 
     # initialize the thieves passes per edge
     for edge in G.edges():
@@ -33,101 +37,117 @@ def initializeGOTGraph(G,noNodes, noVDiamonds):
     return G
 
 
-def ComputeCentrality(G, noThiefs, noVDiamonds,noEpochs, untilConvergence=False, noLastEuclidDists = 10):
+def reportProgress(monitor, k, thiefsList, convergence, final=False):
+    # call the progress hook (see Progress.ProgressMonitor) with the state of the thieves at epoch k
+    carrying = sum([thief.diamond for thief in thiefsList])
+    meanPathLength = float(sum([len(thief.path) for thief in thiefsList])) / max(len(thiefsList), 1)
+    return monitor.report(k, carrying, meanPathLength, None if convergence is None else float(convergence.euclidDist), final)
+
+
+def ComputeCentrality(G, noThiefs, noVDiamonds,noEpochs, untilConvergence=False, noLastEuclidDists = 10, convergenceStride = 1, topK = None,
+                      historyMode = 'full', historyLength = 100, historyEvery = 10, historyFile = None, writeBack = False, seed = None,
+                      progressCallback = None, progressEvery = 100, approximate = False):
     # This is the sequential version of GOT
     # Input:
-    #   G - network to be analyzed
+    #   G - network to be analyzed (the nodes can have any labels; if they are not exactly 0..N-1, the per node arrays of the
+    #       output follow the order of G.nodes() and sortedNodes and sortedEdges contain the node labels)
     #   noThiefs - number of thieves per node
     #   noVDiamonds - number of vdiamonds per node
     #   noEpochs - number of epochs to run the algorithms
     #   untilConvergence - if this parameter is set to True then at each epoch the stopping criteria is checked, otherwise GOT will just run for the given amount of epochs (default False)
     #   noLastEuclidDists - for how many consecutive epochs the stopping criteria is checked (default 10)
+    #   convergenceStride - the stopping criteria is checked every convergenceStride epochs (default 1, at each epoch); a check
+    #                       re-ranks all nodes (O(N log N)), which is negligible next to the moves of this engine but not next
+    #                       to the vectorized ones: on a 200000 nodes scale-free network it adds about 30% to a VectorizedGOT
+    #                       epoch at stride 1 and about 6% at stride 10, the default of VectorizedGOT, ParallelGOT and IncrementalGOT
+    #   topK - if given, only the topK most central nodes are followed: GOT stops as soon as their set and their order did not
+    #          change for noLastEuclidDists consecutive checks (this implies untilConvergence; default None, all nodes)
+    #   historyMode - what is kept from the per epoch vdiamonds (see History.EpochHistory): 'full' (default), 'mean' (only the
+    #                 running sums, bounded memory), 'ring' (the last historyLength epochs), 'downsample' (a snapshot every
+    #                 historyEvery epochs) or 'memmap' (the full history in the memory-mapped .npy file historyFile)
+    #   writeBack - if True, the final amount of vdiamonds per node and thieves passes per edge are written in the 'vdiamonds'
+    #               and 'thiefsPasses' attributes of G (default False, G is not modified)
+    #   seed - seed of the counter-based random numbers of the thieves (default None, a different run each time)
+    #   progressCallback - a function called every progressEvery epochs and at the end of the run with a dict with the time
+    #                      spent in each phase of the epochs, the number of thieves carrying a vdiamond, the mean path length
+    #                      and the last convergence distance (see Progress.ProgressMonitor); if it returns True the run is
+    #                      stopped (default None, no instrumentation at all)
+    #   progressEvery - how often progressCallback is called (default every 100 epochs)
+    #   approximate - if True the thieves are not simulated: the expected scores are estimated with sparse matrix operations
+    #                 (see MarkovGOT.py, much faster on very large networks); the convergence, seed and progress parameters are
+    #                 then not used and the vdiamonds history has one column per integration step (default False)
     # Output:
+    #   a GOTResult (see GOTResult.py), which can still be unpacked as the list [meanVDiamonds, sortedNodes, vdiamonds, meanPassesEdges, sortedEdges, k]:
     #   meanVDiamonds - the average amount of vdiamonds per node after the algorithm stops
     #   sortedNodes - an array with all nodes sorted according with their centrality (from the most important ones to the least important ones)
-    #   vdiamonds - an array with the number of vdiamonds in each nodes at every epoch
+    #   vdiamonds - an array with the number of vdiamonds in each nodes at every epoch (or what historyMode keeps of it)
     #   meanPassesEdges - the average amount of thieves passes per edge after the algorithm stops
     #   sortedEdges - an array with all edges sorted according with their centrality (from the most important ones to the least important ones)
     #   k - the number of the epoch when GOT was stopped
 
-    random.seed()
-    noNodes=nx.number_of_nodes(G)
-    noEdges = G.number_of_edges()
+    if (approximate):
+        # SciPy is needed only by the approximation
+        import MarkovGOT
+        return MarkovGOT.ComputeCentrality(G, noThiefs, noVDiamonds, noEpochs, historyMode=historyMode, historyLength=historyLength,
+                                           historyEvery=historyEvery, historyFile=historyFile, writeBack=writeBack)
+
+    thiefRandom = ThiefRandom.ThiefRandom(seed)
 
-    # initialize GOT parameters on the graph
-    G = initializeGOTGraph(G, noNodes, noVDiamonds)
+    # map the nodes and edges to dense indices once; the GOT counters are kept in the adapter, not in the graph attributes
+    graph = GraphAdapter.GraphAdapter(G, noVDiamonds)
+    noNodes = graph.noNodes
+    noEdges = graph.noEdges
 
     # initialize a list with theives
     thiefsList = []
 
-    edgesList = np.zeros((noEdges,2))
-    i=0
-    for edge in G.edges(data=True):
-        edgesList[i] = np.asarray([edge[0], edge[1]])
-        i += 1
-
-    vdiamonds = np.zeros((noNodes, noEpochs))
-    passesEdges = np.zeros((noEdges, noEpochs))
-    previousNodesRank = np.zeros(noNodes)
-    lastEuclidDists = noNodes + np.zeros(noLastEuclidDists)
+    history = History.EpochHistory(noNodes, noEdges, noEpochs, historyMode, historyLength, historyEvery, historyFile)
+    convergence = Convergence.createCheck(noNodes, noLastEuclidDists, convergenceStride, topK)
 
     # run GOT for a specific number of epochs or until convergence
+    checkConvergence = untilConvergence or topK
+    monitor = Progress.createMonitor(progressCallback, progressEvery, noEpochs)
     k = 0
     while (k < noEpochs):
         k += 1
+        if (monitor is not None):
+            monitor.tic()
 
-        # make a move for each thief
-        for thief in thiefsList:
-            thief.Move(G, k)
+        # make a move for each thief (thief i uses the i-th counter-based random number of epoch k)
+        if (len(thiefsList) > 0):
+            rdProbs = thiefRandom.uniforms(k, 0, len(thiefsList)).tolist()
+            for i in range(len(thiefsList)):
+                thiefsList[i].Move(graph, k, rdProbs[i])
 
         # in the first epoch create the thieves for each node
         if (k == 1):
             for i in range(noNodes):
-                if (G.neighbors(i) != []):
+                if (graph.csr.degrees[i] > 0):
                     for j in range(noThiefs):
                         thiefsList.append(Thief.Thief(i))
-
-        # store the amount of vdiamonds from each node at epoch k
-        for i in range(noNodes):
-            vdiamonds[i, k - 1] = G.node[i]['vdiamonds']
-
-        # store the number of thieves passes on each edge at epoch k
-        i = 0
-        for edge in G.edges(data=True):
-            passesEdges[i, k - 1] = edge[2]['thiefsPasses']
-            i += 1
-
-        # if the GOT algorithm runs until convergence than GOT centrality has to be computed at each epoch
-        # please pay attention as in this way the algorithm is much slower due to the extra computations needed
-        if (untilConvergence):
-
-            meanVDiamonds = np.mean(vdiamonds[:, :k],axis=1)
-            sortedNodes = meanVDiamonds.argsort(axis=0)
-
-            nodesRank = np.zeros(noNodes)
-            for i in range(noNodes):
-                nodesRank[sortedNodes[i]] = i
-            euclidDist = np.sqrt(((nodesRank - previousNodesRank) * (nodesRank - previousNodesRank)).sum())
-            lastEuclidDists = np.roll(lastEuclidDists, -1)
-            lastEuclidDists[noLastEuclidDists - 1] = euclidDist
-            previousNodesRank = nodesRank
-
-            # if stoping criteria is fullfiled then stop the algorithm
-            if ((np.mean(lastEuclidDists) < 0.02 * noNodes)):
-                sortedEdges=np.zeros((noEdges,1,2))
-                meanPassesEdges = np.mean(passesEdges[:, :k],axis=1)
-                sortedEdgesIndex = meanPassesEdges.argsort(axis=0)[::-1]
-                for i in range(noEdges):
-                    sortedEdges[i,0]=edgesList[sortedEdgesIndex[i]]
-                return [meanVDiamonds, sortedNodes, vdiamonds, meanPassesEdges, sortedEdges, k]
-
-    # compute the rank of nodes and edges
-    meanVDiamonds = np.mean(vdiamonds[:, :k], axis=1)
-    sortedNodes = meanVDiamonds.argsort(axis=0)
-
-    sortedEdges = np.zeros((noEdges, 1, 2))
-    meanPassesEdges = np.mean(passesEdges[:, :k], axis=1)
-    sortedEdgesIndex = meanPassesEdges.argsort(axis=0)[::-1]
-    for i in range(noEdges):
-        sortedEdges[i,0] = edgesList[sortedEdgesIndex[i]]
-    return [meanVDiamonds, sortedNodes, vdiamonds,meanPassesEdges, sortedEdges, k]
+        if (monitor is not None):
+            monitor.toc('move')
+
+        # store the amount of vdiamonds from each node and the number of thieves passes on each edge at epoch k
+        history.record(graph.vdiamonds, graph.thiefsPasses)
+        if (monitor is not None):
+            monitor.toc('history')
+
+        # if the GOT algorithm runs until convergence then the stopping criteria is checked every convergenceStride epochs
+        # (incrementally, from a running sum of the vdiamonds)
+        if (checkConvergence):
+            if (convergence.update(graph.vdiamonds)):
+                break
+        if (monitor is not None):
+            monitor.toc('convergence')
+            if (monitor.due(k) and reportProgress(monitor, k, thiefsList, convergence if checkConvergence else None)):
+                break
+    if (monitor is not None):
+        reportProgress(monitor, k, thiefsList, convergence if checkConvergence else None, True)
+
+    # write the final counters in the graph attributes only if it is requested
+    if (writeBack):
+        graph.writeBack(G)
+
+    # the rankings and the history are computed from the history only when they are used
+    return GOTResult.GOTResult(graph.csr, history, k)
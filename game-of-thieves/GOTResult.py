@@ -0,0 +1,113 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+import numpy as np
+
+# the fields of the list returned by ComputeCentrality before GOTResult
+legacyFields = ('meanVDiamonds', 'sortedNodes', 'vdiamonds', 'meanPassesEdges', 'sortedEdges', 'k')
+
+class GOTResult:
+    # the result of a GOT run; the scores are contiguous arrays indexed by node index and edge index, and the rankings and
+    # the history are computed only when they are used
+    #   nodeScores - the average amount of vdiamonds per node (meanVDiamonds, a smaller value means a more central node)
+    #   edgeScores - the average amount of thieves passes per edge (meanPassesEdges, a higher value means a more central edge)
+    #   edgeEndpoints - (noEdges, 2) integer array with the endpoints (node indices) of every edge
+    #   k - the number of the epoch when GOT was stopped
+    # For compatibility the result is also the list [meanVDiamonds, sortedNodes, vdiamonds, meanPassesEdges, sortedEdges, k]
+    # returned before: it can be unpacked, indexed and iterated in the same way.
+    __slots__ = ('csr', 'history', 'nodeScores', 'edgeScores', 'k', 'sortedNodesCache', 'sortedEdgesIndexCache', 'vdiamondsCache')
+
+    def __init__(self, csr, history, k):
+        self.csr = csr
+        self.history = history
+        self.nodeScores = np.ascontiguousarray(history.meanVDiamonds())
+        self.edgeScores = np.ascontiguousarray(history.meanPassesEdges())
+        self.k = k
+        self.sortedNodesCache = None
+        self.sortedEdgesIndexCache = None
+        self.vdiamondsCache = None
+
+    @property
+    def edgeEndpoints(self):
+        return self.csr.edges
+
+    @property
+    def meanVDiamonds(self):
+        return self.nodeScores
+
+    @property
+    def meanPassesEdges(self):
+        return self.edgeScores
+
+    @property
+    def sortedNodes(self):
+        # all nodes (labels) sorted according with their centrality, from the most important ones to the least important ones
+        if (self.sortedNodesCache is None):
+            self.sortedNodesCache = self.csr.toLabels(self.nodeScores.argsort(axis=0))
+        return self.sortedNodesCache
+
+    @property
+    def sortedEdgesIndex(self):
+        # all edge indices sorted according with their centrality, from the most important ones to the least important ones
+        if (self.sortedEdgesIndexCache is None):
+            self.sortedEdgesIndexCache = self.edgeScores.argsort(axis=0)[::-1]
+        return self.sortedEdgesIndexCache
+
+    @property
+    def sortedEdges(self):
+        # the (noEdges, 1, 2) array of the sorted edges, in the format returned before (see CSRGraph.rankedEdges)
+        return self.csr.rankedEdges(self.sortedEdgesIndex)
+
+    @property
+    def vdiamonds(self):
+        # the amount of vdiamonds in each node at every epoch (or what the history mode keeps of it)
+        if (self.vdiamondsCache is None):
+            self.vdiamondsCache = self.history.vdiamonds()
+        return self.vdiamondsCache
+
+    def topNodes(self, n):
+        # Output:
+        #   the n most central nodes (labels), from the most important one, found with a partial sort
+        n = min(n, self.nodeScores.shape[0])
+        if (n <= 0):
+            return self.csr.toLabels(np.zeros(0, dtype=np.int64))
+        top = np.argpartition(self.nodeScores, n - 1)[:n]
+        return self.csr.toLabels(top[np.argsort(self.nodeScores[top], kind='mergesort')])
+
+    def topEdges(self, n):
+        # Output:
+        #   (n, 2) array with the endpoints (labels) of the n most central edges, from the most important one, found with a partial sort
+        n = min(n, self.edgeScores.shape[0])
+        if (n <= 0):
+            return self.csr.toLabels(np.zeros((0, 2), dtype=np.int64))
+        top = np.argpartition(-self.edgeScores, n - 1)[:n]
+        top = top[np.argsort(-self.edgeScores[top], kind='mergesort')]
+        return self.csr.toLabels(self.csr.edges[top])
+
+    def asList(self):
+        return [getattr(self, name) for name in legacyFields]
+
+    def __len__(self):
+        return len(legacyFields)
+
+    def __getitem__(self, i):
+        if (isinstance(i, slice)):
+            return [getattr(self, name) for name in legacyFields[i]]
+        return getattr(self, legacyFields[i])
+
+    def __iter__(self):
+        return (getattr(self, name) for name in legacyFields)
@@ -0,0 +1,75 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+import numpy as np
+import networkx as nx
+import CSRGraph
+import AliasTable
+
+class GraphAdapter:
+    # the graph as seen by the GOT engines: the nodes and edges are mapped once to dense integer indices (CSRGraph) and the
+    # GOT counters are NumPy arrays, so nothing is written in the NetworkX attributes while GOT runs
+    #   G - the NetworkX graph (None if the adapter was built directly from a CSRGraph)
+    #   csr - the CSRGraph of G
+    #   vdiamonds - the amount of vdiamonds per node
+    #   thiefsPasses - the number of thieves passes per edge
+    #   labels - the original label of every node index (None when the nodes of G are labeled 0..N-1)
+    #   aliasTables - the alias tables of the nodes for the thieves of the GOT object engine (built from csr, for this run only)
+    def __init__(self, G, noVDiamonds):
+        if (isinstance(G, CSRGraph.CSRGraph)):
+            self.G = None
+            self.csr = G
+        else:
+            self.G = G
+            self.csr = CSRGraph.fromNetworkX(G)
+        self.noNodes = self.csr.noNodes
+        self.noEdges = self.csr.noEdges
+        self.edges = self.csr.edges
+        self.labels = self.csr.labels
+        self.vdiamonds = np.zeros(self.noNodes, dtype=np.int64) + noVDiamonds
+        self.thiefsPasses = np.zeros(self.noEdges, dtype=np.int64)
+        self.edgeIndex = None
+        self.aliasTables = AliasTable.AliasTables(self.csr)
+
+    def EdgeId(self, u, v):
+        # Output:
+        #   the index of the edge between the nodes u and v (the lookup table is built the first time it is needed)
+        if (self.edgeIndex is None):
+            self.edgeIndex = {}
+            for i in range(self.noEdges):
+                a = int(self.edges[i, 0])
+                b = int(self.edges[i, 1])
+                self.edgeIndex[a * self.noNodes + b] = i
+                self.edgeIndex[b * self.noNodes + a] = i
+        return self.edgeIndex[u * self.noNodes + v]
+
+    def SampleNeighbour(self, node, rdProb):
+        # Output:
+        #   the neighbour (node index) of the node index node chosen with its alias table, proportionally to the edges 'value'
+        return self.aliasTables.get(node).sample(rdProb)
+
+    def writeBack(self, G=None):
+        # write the counters in the 'vdiamonds' node attributes and the 'thiefsPasses' edge attributes of G
+        if (G is None):
+            G = self.G
+        if (G is None):
+            raise ValueError("the adapter was built from a CSRGraph, a NetworkX graph is needed to write back the attributes")
+        nodes = range(self.noNodes) if self.labels is None else self.labels.tolist()
+        nx.set_node_attributes(G, dict(zip(nodes, self.vdiamonds.tolist())), 'vdiamonds')
+        edges = self.csr.toLabels(self.edges).tolist()
+        nx.set_edge_attributes(G, dict(zip([(e[0], e[1]) for e in edges], self.thiefsPasses.tolist())), 'thiefsPasses')
+        return G
@@ -0,0 +1,117 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+import numpy as np
+
+historyModes = ['full', 'mean', 'ring', 'downsample', 'memmap']
+
+class EpochHistory:
+    # stores what is needed from the vdiamonds and thieves passes of every epoch
+    # The means are always computed from running sums (the passes per edge are never stored per epoch); what is kept from
+    # the per epoch vdiamonds depends on the mode:
+    #   'full' - the dense (noNodes x noEpochs) array (default, as GOT always did)
+    #   'mean' - nothing, only the running sums
+    #   'ring' - the last historyLength epochs
+    #   'downsample' - a snapshot every historyEvery epochs
+    #   'memmap' - the full history, written in the memory-mapped .npy file historyFile (column-major, one column per epoch)
+    # resume - if True, the 'memmap' history continues in the existing historyFile instead of creating a new one
+    def __init__(self, noNodes, noEdges, noEpochs, mode='full', historyLength=100, historyEvery=10, historyFile=None, resume=False):
+        if (mode not in historyModes):
+            raise ValueError("unknown history mode " + str(mode) + ", it has to be one of " + str(historyModes))
+        self.mode = mode
+        self.k = 0
+        self.historyEvery = historyEvery
+        self.sumVDiamonds = np.zeros(noNodes)
+        self.sumPassesEdges = np.zeros(noEdges)
+        self.snapshots = None
+        if (mode == 'full'):
+            self.snapshots = np.zeros((noNodes, noEpochs))
+        elif (mode == 'ring'):
+            self.snapshots = np.zeros((noNodes, historyLength))
+        elif (mode == 'downsample'):
+            self.snapshots = np.zeros((noNodes, (noEpochs + historyEvery - 1) // historyEvery))
+        elif (mode == 'memmap'):
+            if (historyFile is None):
+                raise ValueError("the 'memmap' history mode needs a historyFile")
+            if (resume):
+                self.snapshots = np.lib.format.open_memmap(historyFile, mode='r+')
+                if (self.snapshots.shape != (noNodes, noEpochs)):
+                    raise ValueError("the history file " + str(historyFile) + " does not match the resumed run")
+            else:
+                self.snapshots = np.lib.format.open_memmap(historyFile, mode='w+', dtype=np.float64, shape=(noNodes, noEpochs), fortran_order=True)
+
+    def record(self, vdiamonds, thiefsPasses):
+        # store the amount of vdiamonds from each node and the number of thieves passes on each edge at the next epoch
+        self.k += 1
+        self.sumVDiamonds += vdiamonds
+        self.sumPassesEdges += thiefsPasses
+        if (self.mode == 'full' or self.mode == 'memmap'):
+            self.snapshots[:, self.k - 1] = vdiamonds
+        elif (self.mode == 'ring'):
+            self.snapshots[:, (self.k - 1) % self.snapshots.shape[1]] = vdiamonds
+        elif (self.mode == 'downsample' and (self.k - 1) % self.historyEvery == 0):
+            self.snapshots[:, (self.k - 1) // self.historyEvery] = vdiamonds
+
+    def storedColumns(self):
+        # the number of columns of snapshots filled so far
+        if (self.mode == 'ring'):
+            return min(self.k, self.snapshots.shape[1])
+        if (self.mode == 'downsample'):
+            return (self.k + self.historyEvery - 1) // self.historyEvery
+        if (self.mode == 'full'):
+            return self.k
+        return 0
+
+    def getState(self):
+        # Output:
+        #   a copy of the history (for the checkpoints); the 'memmap' history is already on disk and it is not copied
+        state = {'k': self.k, 'sumVDiamonds': self.sumVDiamonds.copy(), 'sumPassesEdges': self.sumPassesEdges.copy()}
+        if (self.snapshots is not None and self.mode != 'memmap'):
+            state['snapshots'] = self.snapshots[:, :self.storedColumns()].copy()
+        return state
+
+    def setState(self, state):
+        # continue the history from a state returned by getState (the history may be longer than the one of the state)
+        self.k = state['k']
+        self.sumVDiamonds[:] = state['sumVDiamonds']
+        self.sumPassesEdges[:] = state['sumPassesEdges']
+        if ('snapshots' in state):
+            columns = state['snapshots'].shape[1]
+            if (columns > self.snapshots.shape[1] or (self.mode == 'ring' and columns != min(self.k, self.snapshots.shape[1]))):
+                raise ValueError("the stored history does not fit in the history of the resumed run")
+            self.snapshots[:, :columns] = state['snapshots']
+
+    def meanVDiamonds(self):
+        return self.sumVDiamonds / self.k
+
+    def meanPassesEdges(self):
+        return self.sumPassesEdges / self.k
+
+    def vdiamonds(self):
+        # Output:
+        #   the stored vdiamonds history ('full' and 'memmap': all epochs, with zeros after the stopping epoch as before;
+        #   'ring': the last epochs in chronological order; 'downsample': epochs 1, 1+historyEvery, ...; 'mean': None)
+        if (self.mode == 'memmap'):
+            self.snapshots.flush()
+        if (self.mode == 'ring'):
+            length = self.snapshots.shape[1]
+            if (self.k < length):
+                return self.snapshots[:, :self.k]
+            return np.roll(self.snapshots, -(self.k % length), axis=1)
+        if (self.mode == 'downsample'):
+            return self.snapshots[:, :(self.k + self.historyEvery - 1) // self.historyEvery]
+        return self.snapshots
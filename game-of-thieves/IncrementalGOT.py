@@ -0,0 +1,177 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+# GOT on evolving graphs: the thieves and the counters of a vectorized run are kept between calls, the graph is changed with
+# a delta (edges added or removed, new nodes) and the run continues from its previous state (warm start) instead of
+# starting again with noVDiamonds in every node and no thieves passes.
+
+import numpy as np
+import CSRGraph
+import GraphAdapter
+import Convergence
+import History
+import ThiefRandom
+import VectorizedGOT
+import Progress
+
+class IncrementalGOT:
+    # Input:
+    #   G - the initial network (a NetworkX graph with any node labels, or a CSRGraph); when the nodes are not labeled
+    #       0..N-1 the updates and the results use the node labels; G itself is not tracked, the changes are given to update
+    #   noThiefs - number of thieves per node
+    #   noVDiamonds - number of vdiamonds per node (also given to the new nodes)
+    #   seed - seed of the counter-based random numbers of the thieves (default None, a different run each time)
+    def __init__(self, G, noThiefs, noVDiamonds, seed=None):
+        self.noThiefs = noThiefs
+        self.noVDiamonds = noVDiamonds
+        self.thiefRandom = ThiefRandom.ThiefRandom(seed)
+        self.graph = GraphAdapter.GraphAdapter(G, noVDiamonds)
+        csr = self.graph.csr
+        self.thieves = VectorizedGOT.ThiefPopulation(np.repeat(np.flatnonzero(csr.degrees > 0), noThiefs), csr.indexType)
+        self.k = 0
+
+    def run(self, noEpochs, untilConvergence=False, noLastEuclidDists=10, convergenceStride=10, topK=None, historyMode='full', historyLength=100,
+            historyEvery=10, historyFile=None, progressCallback=None, progressEvery=100):
+        # continue the run for (at most) noEpochs epochs
+        # Input:
+        #   the same as for VectorizedGOT.ComputeCentrality
+        # Output:
+        #   the same as VectorizedGOT.ComputeCentrality; the means and the history cover only the epochs of this call and
+        #   k is the number of epochs since the start of the run
+        parameters = {'noThiefs': self.noThiefs, 'noEpochs': self.k + noEpochs, 'untilConvergence': untilConvergence, 'topK': topK or 0,
+                      'checkpointEvery': 0, 'checkpointSeconds': 0}
+        history = History.EpochHistory(self.graph.noNodes, self.graph.noEdges, noEpochs, historyMode, historyLength, historyEvery, historyFile)
+        convergence = Convergence.createCheck(self.graph.noNodes, noLastEuclidDists, convergenceStride, topK)
+        monitor = Progress.createMonitor(progressCallback, progressEvery, self.k + noEpochs)
+        result = VectorizedGOT.runEpochs(self.graph, self.thieves, history, convergence, self.thiefRandom, self.k, parameters, False, None, monitor)
+        self.k = result.k
+        return result
+
+    def update(self, addedEdges=(), removedEdges=(), noNodes=None):
+        # change the graph and repair the state of the run
+        # Input:
+        #   addedEdges - the new edges, as (u, v) or (u, v, value) (the nodes with new indices, or new labels, are created)
+        #   removedEdges - the removed edges, as (u, v)
+        #   noNodes - the new number of nodes, for new nodes without edges (default None, as given by addedEdges; only for
+        #             graphs with the nodes labeled 0..N-1)
+        # The thieves whose path uses a removed edge go back to the last node of their path which they can still reach (a
+        # thief which is sent home drops its vdiamond there), the thieves of the nodes left without edges are removed and the
+        # new nodes (and the old isolated nodes which got edges) receive noVDiamonds and their own thieves.
+        csr = self.graph.csr
+        oldNoNodes = csr.noNodes
+        labels = csr.labels
+        if (labels is not None):
+            # the graph has its own node labels: the edges are given with labels and the new labels get new indices
+            newLabels = {}
+            addedEdges = labelsToIndices(csr, addedEdges, newLabels)
+            removedEdges = labelsToIndices(csr, removedEdges, None)
+            if (noNodes is not None and noNodes > oldNoNodes + len(newLabels)):
+                raise ValueError("the new nodes of a graph with node labels have to be given by their edges")
+            labels = np.concatenate((np.asarray(labels, dtype=object), np.fromiter(newLabels, dtype=object, count=len(newLabels))))
+        [addedEnds, addedWeights] = edgeArrays(addedEdges)
+        removedEnds = edgeArrays(removedEdges)[0]
+        newNoNodes = max(oldNoNodes, int(addedEnds.max(initial=-1)) + 1, noNodes or 0)
+
+        # the index of every old edge in the new graph (-1 for the removed edges)
+        oldKeys = edgeKeys(csr.edges, newNoNodes)
+        order = np.argsort(oldKeys, kind='mergesort')
+        sortedKeys = oldKeys[order]
+        removedKeys = edgeKeys(removedEnds, newNoNodes)
+        position = np.searchsorted(sortedKeys, removedKeys)
+        found = position < csr.noEdges
+        found[found] = sortedKeys[position[found]] == removedKeys[found]
+        if (not found.all()):
+            raise ValueError("some of the removed edges are not in the graph")
+        keep = np.ones(csr.noEdges, dtype=bool)
+        keep[order[position]] = False
+        edgeMap = np.zeros(csr.noEdges, dtype=np.int64) - 1
+        edgeMap[keep] = np.arange(int(keep.sum()))
+        addedKeys = edgeKeys(addedEnds, newNoNodes)
+        if (np.unique(addedKeys).shape[0] < addedKeys.shape[0] or np.intersect1d(oldKeys[keep], addedKeys).shape[0] > 0):
+            raise ValueError("some of the added edges are already in the graph")
+
+        newCsr = CSRGraph.CSRGraph(newNoNodes, np.concatenate((csr.edges[keep].astype(np.int64), addedEnds)),
+                                   np.concatenate((csr.weights[keep], addedWeights)), labels)
+        graph = GraphAdapter.GraphAdapter(newCsr, self.noVDiamonds)
+        graph.vdiamonds[:oldNoNodes] = self.graph.vdiamonds
+        graph.thiefsPasses[:int(keep.sum())] = self.graph.thiefsPasses[keep]
+
+        # repair the paths which use a removed edge
+        thieves = self.thieves.getState()
+        pathLen = thieves['pathLen']
+        width = thieves['pathEdges'].shape[1]
+        pathEdges = edgeMap[thieves['pathEdges']]
+        broken = (pathEdges < 0) & (np.arange(width) < pathLen[:, None])
+        repaired = np.flatnonzero(broken.any(axis=1))
+        firstBroken = broken[repaired].argmax(axis=1)
+        thieves['position'][repaired] = thieves['pathNodes'][repaired, firstBroken]
+        pathLen[repaired] = firstBroken
+        thieves['pathEdges'] = np.maximum(pathEdges, 0)
+        home = repaired[(firstBroken == 0) & (thieves['diamond'][repaired] == 1)]
+        thieves['diamond'][home] = 0
+        graph.vdiamonds += np.bincount(thieves['origin'][home], minlength=newNoNodes)
+
+        # remove the thieves of the nodes without edges (they are all at home) and create the thieves of the nodes with edges
+        alive = newCsr.degrees[thieves['origin']] > 0
+        hasThieves = np.bincount(thieves['origin'][alive], minlength=newNoNodes) > 0
+        newOrigins = np.repeat(np.flatnonzero((newCsr.degrees > 0) & ~hasThieves), self.noThiefs)
+        noNew = newOrigins.shape[0]
+        for name in ['origin', 'position', 'diamond', 'pathNodes', 'pathEdges', 'pathLen']:
+            thieves[name] = thieves[name][alive]
+        thieves['origin'] = np.concatenate((thieves['origin'], newOrigins)).astype(newCsr.indexType)
+        thieves['position'] = np.concatenate((thieves['position'], newOrigins)).astype(newCsr.indexType)
+        thieves['diamond'] = np.concatenate((thieves['diamond'], np.zeros(noNew, dtype=np.int8)))
+        thieves['pathNodes'] = np.concatenate((thieves['pathNodes'], np.zeros((noNew, width), dtype=np.int64))).astype(newCsr.indexType)
+        thieves['pathEdges'] = np.concatenate((thieves['pathEdges'], np.zeros((noNew, width), dtype=np.int64))).astype(newCsr.indexType)
+        thieves['pathLen'] = np.concatenate((thieves['pathLen'], np.zeros(noNew, dtype=np.int64)))
+        self.thieves.setState(thieves)
+        self.graph = graph
+        return self.graph.csr
+
+
+def labelsToIndices(csr, edges, newLabels):
+    # Output:
+    #   the edges with the node labels replaced by node indices; the unknown labels get new indices, kept in the dict
+    #   newLabels (if newLabels is None the unknown labels are an error)
+    result = []
+    for edge in edges:
+        ends = []
+        for label in edge[:2]:
+            try:
+                ends.append(csr.indexOf(label))
+            except KeyError:
+                if (newLabels is None):
+                    raise ValueError("the node " + str(label) + " is not in the graph")
+                ends.append(newLabels.setdefault(label, csr.noNodes + len(newLabels)))
+        result.append(tuple(ends) + tuple(edge[2:]))
+    return result
+
+def edgeArrays(edges):
+    # Output:
+    #   ends - (noEdges, 2) array with the endpoints of the edges given as (u, v) or (u, v, value)
+    #   weights - the value of every edge (1 if it is not given)
+    if (len(edges) == 0):
+        return [np.zeros((0, 2), dtype=np.int64), np.zeros(0)]
+    edges = [tuple(edge) for edge in edges]
+    ends = np.array([edge[:2] for edge in edges], dtype=np.int64)
+    weights = np.array([edge[2] if len(edge) > 2 else 1 for edge in edges], dtype=np.float64)
+    return [ends, weights]
+
+def edgeKeys(ends, noNodes):
+    # a key per undirected edge (independent of the order of its endpoints)
+    ends = ends.astype(np.int64)
+    return np.minimum(ends[:, 0], ends[:, 1]) * noNodes + np.maximum(ends[:, 0], ends[:, 1])
@@ -0,0 +1,140 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+# Approximate GOT: instead of simulating the thieves, the expected flows of thieves and vdiamonds are computed with sparse
+# transition matrix operations (a mean-field model of the game). The search of a thief is a random walk proportional to the
+# edges 'value' (the transition matrix P = D^-1 W); a thief arriving at a node which still has vdiamonds takes one and goes back
+# home on the same path, so a trip of d steps out takes 2d epochs. Given the probability a[w] that a thief arriving at node w
+# finds a vdiamond there:
+#   - the expected number of steps out of a thief of node o is sum_d (M^d 1)[o], with M = P diag(1 - a), and its thieves leave
+#     home (and bring back a vdiamond) at the rate noThiefs / (2 * steps);
+#   - the thieves arriving at each node are propagated with P^T, a fraction a of them taking a vdiamond at each step;
+#   - every step out of a thief which finds a vdiamond is walked back, so the thieves passes of an edge are the expected
+#     number of searching thieves crossing it.
+# The vdiamonds of each node then change by (returned - taken) vdiamonds per epoch; the run is integrated in noSteps steps of
+# noEpochs / noSteps epochs each, and a is set, at every step, so that a node never gives more vdiamonds than it has.
+# The loops of the walks (which GOT cuts from the paths) and the first epochs, in which all thieves leave home together, are
+# not modeled: the scores are estimates of the GOT scores, much faster to compute on very large graphs.
+
+import numpy as np
+import scipy.sparse
+import GraphAdapter
+import History
+import GOTResult
+
+def transitionMatrix(csr):
+    # Output:
+    #   P - the (noNodes x noNodes) sparse transition matrix of the walk of a searching thief
+    #   PT - the transpose of P (in CSR format)
+    #   crossing - the (noEdges x noNodes) sparse matrix which gives the number of thieves crossing each edge (in any
+    #              direction) from the number of searching thieves at each node
+    arcSource = np.repeat(np.arange(csr.noNodes), csr.degrees)
+    arcProbs = csr.weights[csr.arcEdges] / csr.rowTotal[arcSource]
+    P = scipy.sparse.csr_matrix((arcProbs, csr.indices, csr.indptr), shape=(csr.noNodes, csr.noNodes))
+    crossing = scipy.sparse.csr_matrix((arcProbs, (csr.arcEdges, arcSource)), shape=(csr.noEdges, csr.noNodes))
+    return [P, P.T.tocsr(), crossing]
+
+def expectedFlows(P, PT, thieves, availability, maxDepth, tolerance=1e-9):
+    # the expected flows per epoch for the probabilities availability that a thief finds a vdiamond at each node
+    # Output:
+    #   returned - the vdiamonds brought home per node (the rate at which the thieves of each node leave home)
+    #   taken - the vdiamonds taken per node
+    #   arrivals - the searching thieves arriving at each node
+    #   searching - the searching thieves leaving each node (crossing.dot(searching) are the thieves passes per edge)
+    miss = 1.0 - availability
+
+    # the expected number of steps out of the thieves of each node (at most maxDepth)
+    steps = np.zeros(thieves.shape[0])
+    survival = np.ones(thieves.shape[0])
+    for d in range(maxDepth):
+        steps += survival
+        survival = P.dot(miss * survival)
+        if (survival.max(initial=0) < tolerance):
+            break
+    returned = thieves / (2.0 * steps)
+
+    # propagate the searching thieves from their homes
+    taken = np.zeros(thieves.shape[0])
+    arrivals = np.zeros(thieves.shape[0])
+    searching = returned.copy()
+    moving = returned
+    for d in range(maxDepth):
+        arriving = PT.dot(moving)
+        arrivals += arriving
+        taken += availability * arriving
+        moving = miss * arriving
+        if (moving.max(initial=0) < tolerance):
+            break
+        searching += moving
+    return [returned, taken, arrivals, searching]
+
+def updateAvailability(returned, arrivals, vdiamonds, stepEpochs):
+    # the fraction of the arriving thieves which can be served in the next step: the vdiamonds of the node spread over the
+    # step plus the ones brought home during the step
+    supply = returned + vdiamonds / stepEpochs
+    availability = np.ones(vdiamonds.shape[0])
+    demand = arrivals > 0
+    availability[demand] = np.minimum(1.0, supply[demand] / arrivals[demand])
+    return availability
+
+
+def ComputeCentrality(G, noThiefs, noVDiamonds, noEpochs, noSteps=20, maxDepth=32, noIterations=1, historyMode='full', historyLength=100,
+                      historyEvery=10, historyFile=None, writeBack=False):
+    # This is the approximate (mean-field) version of GOT
+    # Input:
+    #   G, noThiefs, noVDiamonds, noEpochs, writeBack - the same as for GOT.ComputeCentrality
+    #   noSteps - number of integration steps (default 20, or noEpochs if it is smaller)
+    #   maxDepth - the walks of the searching thieves are followed for at most maxDepth steps (default 32)
+    #   noIterations - how many times the availability of the vdiamonds is refined at each step (default 1)
+    #   historyMode, historyLength, historyEvery, historyFile - the same as for GOT.ComputeCentrality, applied to the steps
+    # Output:
+    #   the same as GOT.ComputeCentrality; the scores are expected values (floats), the vdiamonds history has one column per
+    #   step (at the middle of the step) and k is noEpochs
+    graph = GraphAdapter.GraphAdapter(G, noVDiamonds)
+    csr = graph.csr
+    [P, PT, crossing] = transitionMatrix(csr)
+    thieves = np.where(csr.degrees > 0, float(noThiefs), 0.0)
+
+    noSteps = max(min(noSteps, noEpochs), 1)
+    stepEpochs = float(noEpochs) / noSteps
+    history = History.EpochHistory(csr.noNodes, csr.noEdges, noSteps, historyMode, historyLength, historyEvery, historyFile)
+
+    vdiamonds = graph.vdiamonds.astype(np.float64)
+    thiefsPasses = np.zeros(csr.noEdges)
+    availability = np.ones(csr.noNodes)
+    for step in range(noSteps):
+        # find the availability of the vdiamonds for which no node gives more vdiamonds than it has in this step
+        for i in range(noIterations):
+            [returned, taken, arrivals, searching] = expectedFlows(P, PT, thieves, availability, maxDepth)
+            availability = updateAvailability(returned, arrivals, vdiamonds, stepEpochs)
+        [returned, taken, arrivals, searching] = expectedFlows(P, PT, thieves, availability, maxDepth)
+        passes = crossing.dot(searching)
+
+        # integrate the flows over the step; the history gets the counters in the middle of the step
+        change = stepEpochs * (returned - taken)
+        history.record(np.maximum(vdiamonds + change / 2, 0), thiefsPasses + stepEpochs * passes / 2)
+        vdiamonds = np.maximum(vdiamonds + change, 0)
+        thiefsPasses += stepEpochs * passes
+
+    # write the final (rounded) expected counters in the graph attributes only if it is requested
+    if (writeBack):
+        graph.vdiamonds[:] = np.rint(vdiamonds).astype(np.int64)
+        graph.thiefsPasses[:] = np.rint(thiefsPasses).astype(np.int64)
+        graph.writeBack()
+
+    # the rankings and the history are computed from the history only when they are used
+    return GOTResult.GOTResult(csr, history, noEpochs)
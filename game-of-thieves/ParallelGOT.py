@@ -0,0 +1,262 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+# Multi-process version of VectorizedGOT. The thieves are split in contiguous shards (by thief index), one per worker process.
+# Every worker moves its own thieves and writes its deltas (vdiamonds dropped home, vdiamonds requested, thieves passes) in
+# shared memory; the deltas are reconciled at the end of each epoch, every worker reducing its own slice of nodes and edges.
+#
+# Equivalence with the sequential run: the bookkeeping is exactly the one of VectorizedGOT (the vdiamonds of a node are given
+# to the thieves which arrived there in the order of their global index, after the returning thieves dropped theirs) and the
+# random number of each thief at each epoch depends only on (seed, epoch, thief index) (see ThiefRandom), so with the same
+# seed the result is identical to VectorizedGOT.ComputeCentrality, whatever the number of workers.
+
+import multiprocessing
+import threading
+import numpy as np
+import GraphAdapter
+import Convergence
+import History
+import GOTResult
+import ThiefRandom
+import Progress
+import VectorizedGOT
+
+# seconds the main process waits for the workers to exit at the end of a run before terminating them
+workerTimeout = 10.0
+
+class WorkerWatcher:
+    # a thread of the main process which aborts the barrier as soon as a worker process exits during the run (e.g. killed
+    # or failed before reaching the barrier), so that the main process does not wait forever for it
+    def __init__(self, workers, barrier, interval=0.2):
+        self.workers = workers
+        self.barrier = barrier
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.watch)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def watch(self):
+        while (not self.stopped.wait(self.interval)):
+            if (any(worker.exitcode is not None for worker in self.workers)):
+                self.barrier.abort()
+                return
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+
+def sharedArray(shape, dtype):
+    # allocate a zeroed array in shared memory
+    size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    return [multiprocessing.RawArray('b', max(size, 1)), shape, dtype]
+
+def sharedView(buffer):
+    return np.frombuffer(buffer[0], dtype=buffer[2], count=int(np.prod(buffer[1]))).reshape(buffer[1])
+
+def shardWorker(w, noWorkers, origins, firstThief, csr, buffers, barrier, stopFlag, seed, collectStats=False):
+    # the epoch loop of one worker; it is synchronized with the other workers and with the main process by barrier (which it
+    # aborts if it fails)
+    # if collectStats is True the worker also writes the number of its thieves carrying a vdiamond and the sum of their path
+    # lengths at the end of each epoch (for the progress hook)
+    vdiamonds = sharedView(buffers['vdiamonds'])
+    thiefsPasses = sharedView(buffers['thiefsPasses'])
+    deposits = sharedView(buffers['deposits'])[w]
+    requests = sharedView(buffers['requests'])
+    taken = sharedView(buffers['taken'])[w]
+    passesDelta = sharedView(buffers['passesDelta'])
+    allDeposits = sharedView(buffers['deposits'])
+    allTaken = sharedView(buffers['taken'])
+    stats = sharedView(buffers['stats'])[w]
+    nodeSlice = np.array_split(np.arange(csr.noNodes), noWorkers)[w]
+    edgeSlice = np.array_split(np.arange(csr.noEdges), noWorkers)[w]
+    nodeSlice = slice(nodeSlice[0], nodeSlice[-1] + 1) if nodeSlice.shape[0] > 0 else slice(0, 0)
+    edgeSlice = slice(edgeSlice[0], edgeSlice[-1] + 1) if edgeSlice.shape[0] > 0 else slice(0, 0)
+
+    thiefRandom = ThiefRandom.ThiefRandom(seed)
+    thieves = VectorizedGOT.ThiefPopulation(origins, csr.indexType, firstThief)
+
+    # the thieves are created in the first epoch and move from the second one
+    k = 1
+    try:
+        while (True):
+            barrier.wait()
+            if (stopFlag.value):
+                break
+            k += 1
+
+            # phase 1: move the own thieves and count the vdiamonds dropped home and the vdiamonds requested per node
+            deposits[:] = 0
+            passesDelta[w, :] = 0
+            searching = np.flatnonzero(thieves.diamond == 0)
+            thieves.Back(deposits, passesDelta[w])
+            takers = np.zeros(0, dtype=np.int64)
+            if (searching.shape[0] > 0):
+                moveTo = thieves.Search(csr, searching, thieves.uniforms(thiefRandom, k)[searching])
+                takers = searching[moveTo != thieves.origin[searching]]
+            requests[w, :] = np.bincount(thieves.position[takers], minlength=csr.noNodes)
+            barrier.wait()
+
+            # phase 2: for the own slice of nodes compute how many vdiamonds are still available for each worker, as if the
+            # requests of the workers with smaller thieves indices were served first; reduce the own slice of edges
+            available = vdiamonds[nodeSlice] + allDeposits[:, nodeSlice].sum(axis=0)
+            requestsBefore = np.cumsum(requests[:, nodeSlice], axis=0) - requests[:, nodeSlice]
+            requests[:, nodeSlice] = available - requestsBefore
+            thiefsPasses[edgeSlice] += passesDelta[:, edgeSlice].sum(axis=0)
+            barrier.wait()
+
+            # phase 3: give the vdiamonds to the own thieves
+            available = requests[w].copy()
+            thieves.TakeDiamond(available, takers)
+            taken[:] = requests[w] - available
+            barrier.wait()
+
+            # phase 4: update the amount of vdiamonds of the own slice of nodes
+            vdiamonds[nodeSlice] += allDeposits[:, nodeSlice].sum(axis=0) - allTaken[:, nodeSlice].sum(axis=0)
+            if (collectStats):
+                stats[0] = np.count_nonzero(thieves.diamond)
+                stats[1] = thieves.pathLen.sum()
+            barrier.wait()
+    except threading.BrokenBarrierError:
+        # the main process or another worker stopped the run
+        return
+    except BaseException:
+        # let the main process and the other workers fail instead of waiting forever at the barrier
+        barrier.abort()
+        raise
+
+
+def ComputeCentrality(G, noThiefs, noVDiamonds, noEpochs, untilConvergence=False, noLastEuclidDists=10, convergenceStride=10, topK=None,
+                      historyMode='full', historyLength=100, historyEvery=10, historyFile=None, writeBack=False, noWorkers=None, seed=None,
+                      progressCallback=None, progressEvery=100):
+    # This is the multi-process version of GOT
+    # Input and output are the same as for VectorizedGOT.ComputeCentrality, plus:
+    #   noWorkers - number of worker processes (default the number of CPUs)
+    #   seed - seed of the counter-based random numbers of the thieves (default None, a different run each time)
+    #   progressCallback, progressEvery - the same as for GOT.ComputeCentrality (the 'move' phase is the time spent waiting
+    #                                     for the workers)
+    graph = GraphAdapter.GraphAdapter(G, noVDiamonds)
+    csr = graph.csr
+    noNodes = csr.noNodes
+    noEdges = csr.noEdges
+    if (noWorkers is None):
+        noWorkers = multiprocessing.cpu_count()
+
+    # shared state: the global counters and the per worker deltas of one epoch
+    buffers = {}
+    buffers['vdiamonds'] = sharedArray((noNodes,), np.int64)
+    buffers['thiefsPasses'] = sharedArray((noEdges,), np.int64)
+    buffers['deposits'] = sharedArray((noWorkers, noNodes), np.int32)
+    buffers['requests'] = sharedArray((noWorkers, noNodes), np.int64)
+    buffers['taken'] = sharedArray((noWorkers, noNodes), np.int32)
+    buffers['passesDelta'] = sharedArray((noWorkers, noEdges), np.int32)
+    buffers['stats'] = sharedArray((noWorkers, 2), np.int64)
+    vdiamonds = sharedView(buffers['vdiamonds'])
+    thiefsPasses = sharedView(buffers['thiefsPasses'])
+    vdiamonds[:] = graph.vdiamonds
+
+    # split the thieves (created in the first epoch, as in VectorizedGOT) in contiguous shards
+    origins = np.repeat(np.flatnonzero(csr.degrees > 0), noThiefs)
+    shards = np.array_split(origins, noWorkers)
+    firstThieves = np.cumsum([0] + [shard.shape[0] for shard in shards])
+    if (seed is None):
+        seed = ThiefRandom.ThiefRandom().seed
+
+    try:
+        context = multiprocessing.get_context('fork')
+    except ValueError:
+        context = multiprocessing.get_context()
+    barrier = context.Barrier(noWorkers + 1)
+    stopFlag = context.RawValue('b', 0)
+    workers = []
+    for w in range(noWorkers):
+        worker = context.Process(target=shardWorker, args=(w, noWorkers, shards[w], int(firstThieves[w]), csr, buffers, barrier, stopFlag, seed, progressCallback is not None))
+        worker.daemon = True
+        worker.start()
+        workers.append(worker)
+
+    history = History.EpochHistory(noNodes, noEdges, noEpochs, historyMode, historyLength, historyEvery, historyFile)
+    convergence = Convergence.createCheck(noNodes, noLastEuclidDists, convergenceStride, topK)
+
+    # run GOT for a specific number of epochs or until convergence
+    checkConvergence = untilConvergence or topK
+    monitor = Progress.createMonitor(progressCallback, progressEvery, noEpochs)
+    stats = sharedView(buffers['stats'])
+    noThieves = origins.shape[0]
+    watcher = WorkerWatcher(workers, barrier)
+    finished = False
+    try:
+        k = 0
+        while (k < noEpochs):
+            k += 1
+            if (monitor is not None):
+                monitor.tic()
+
+            # make a move for each thief (the workers run the four phases of the epoch)
+            if (k > 1):
+                for phase in range(5):
+                    barrier.wait()
+            if (monitor is not None):
+                monitor.toc('move')
+
+            # store the amount of vdiamonds from each node and the number of thieves passes on each edge at epoch k
+            history.record(vdiamonds, thiefsPasses)
+            if (monitor is not None):
+                monitor.toc('history')
+
+            if (checkConvergence and convergence.update(vdiamonds)):
+                break
+            if (monitor is not None):
+                monitor.toc('convergence')
+                if (monitor.due(k) and monitor.report(k, stats[:, 0].sum(), float(stats[:, 1].sum()) / max(noThieves, 1),
+                                                      float(convergence.euclidDist) if checkConvergence else None)):
+                    break
+        if (monitor is not None):
+            monitor.report(k, stats[:, 0].sum(), float(stats[:, 1].sum()) / max(noThieves, 1),
+                           float(convergence.euclidDist) if checkConvergence else None, True)
+        finished = True
+    except threading.BrokenBarrierError:
+        for worker in workers:
+            worker.join(timeout=1.0)
+        raise RuntimeError("a ParallelGOT worker failed (exit codes " + str([worker.exitcode for worker in workers]) + ")")
+    finally:
+        # after a normal end the workers are released from their last barrier and exit; otherwise (an error or an
+        # interruption, maybe in the middle of an epoch) the barrier is aborted and the workers are terminated
+        watcher.stop()
+        stopFlag.value = 1
+        if (finished):
+            try:
+                barrier.wait(timeout=workerTimeout)
+            except threading.BrokenBarrierError:
+                pass
+        else:
+            barrier.abort()
+        for worker in workers:
+            worker.join(timeout=workerTimeout if finished else 0.1)
+            if (worker.is_alive()):
+                worker.terminate()
+                worker.join()
+
+    # write the final counters in the graph attributes only if it is requested
+    graph.vdiamonds[:] = vdiamonds
+    graph.thiefsPasses[:] = thiefsPasses
+    if (writeBack):
+        graph.writeBack()
+
+    # the rankings and the history are computed from the history only when they are used
+    return GOTResult.GOTResult(csr, history, k)
@@ -0,0 +1,69 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+import time
+
+# the phases of an epoch which are timed
+phases = ['move', 'history', 'convergence', 'checkpoint']
+
+class ProgressMonitor:
+    # the progress hook of the epoch loop: it times the phases of each epoch and calls callback every `every` epochs (and
+    # once at the end of the run) with a dict:
+    #   'epoch', 'noEpochs' - the current epoch and the maximum number of epochs
+    #   'elapsed' - seconds since the start of the loop
+    #   'phaseTimes' - the seconds spent so far in each phase ('move', 'history', 'convergence', 'checkpoint')
+    #   'carryingThieves' - the number of thieves carrying a vdiamond
+    #   'meanPathLength' - the mean length of the thieves paths
+    #   'convergenceDistance' - the last distance of the stopping criteria (None if it is not checked)
+    #   'final' - True for the call at the end of the run
+    # If callback returns True the run is stopped after the current epoch (e.g. a run which stalls).
+    # The engines create a monitor only if a callback is given, so without it the loop is not timed at all.
+    def __init__(self, callback, every, noEpochs):
+        self.callback = callback
+        self.every = max(int(every), 1)
+        self.noEpochs = noEpochs
+        self.phaseTimes = dict((phase, 0.0) for phase in phases)
+        self.start = time.perf_counter()
+        self.last = self.start
+
+    def tic(self):
+        self.last = time.perf_counter()
+
+    def toc(self, phase):
+        # add the time since the last tic/toc to phase
+        now = time.perf_counter()
+        self.phaseTimes[phase] += now - self.last
+        self.last = now
+
+    def due(self, k):
+        return k % self.every == 0
+
+    def report(self, k, carryingThieves, meanPathLength, convergenceDistance, final=False):
+        # Output:
+        #   True if the callback asks to stop the run
+        stop = self.callback({'epoch': k, 'noEpochs': self.noEpochs, 'elapsed': time.perf_counter() - self.start,
+                              'phaseTimes': dict(self.phaseTimes), 'carryingThieves': int(carryingThieves),
+                              'meanPathLength': float(meanPathLength), 'convergenceDistance': convergenceDistance, 'final': final})
+        return bool(stop) and not final
+
+
+def createMonitor(callback, every, noEpochs):
+    # Output:
+    #   a ProgressMonitor, or None if there is no callback (then the loop is not instrumented)
+    if (callback is None):
+        return None
+    return ProgressMonitor(callback, every, noEpochs)
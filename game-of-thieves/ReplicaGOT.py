@@ -0,0 +1,221 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+# Several independent GOT runs (replicas) in one pass: the thieves of all replicas live in one ThiefPopulation on a stacked
+# graph, in which node v of replica r is the virtual node r * noNodes + v and edge e of replica r is the virtual edge
+# r * noEdges + e. The graph index (CSRGraph) is built once and shared by all replicas, and one epoch step moves the thieves of
+# all replicas together. Replica r uses its own counter-based random numbers (seed + r), so it is exactly the run of
+# VectorizedGOT.ComputeCentrality with the seed seed + r.
+
+import numpy as np
+import GraphAdapter
+import History
+import ThiefRandom
+import Progress
+import VectorizedGOT
+
+class ReplicaGraph:
+    # the stacked graph of noReplicas replicas of csr, as seen by a ThiefPopulation (only the neighbour sampling is needed)
+    def __init__(self, csr, noReplicas):
+        self.csr = csr
+        self.noReplicas = noReplicas
+        self.noNodes = noReplicas * csr.noNodes
+        self.noEdges = noReplicas * csr.noEdges
+        self.indexType = np.int32 if max(self.noNodes, 2 * self.noEdges) < np.iinfo(np.int32).max else np.int64
+
+    def sampleNeighbours(self, nodes, rdProb):
+        # the same as CSRGraph.sampleNeighbours, for the virtual nodes and edges of the replicas
+        replicas = nodes // self.csr.noNodes
+        [moveTo, edgeIds] = self.csr.sampleNeighbours(nodes - replicas * self.csr.noNodes, rdProb)
+        return [(moveTo + replicas * self.csr.noNodes).astype(self.indexType, copy=False),
+                (edgeIds + replicas * self.csr.noEdges).astype(self.indexType, copy=False)]
+
+
+class ReplicaRandom:
+    # the random numbers of the stacked thieves: thief t of replica r gets the number of thief t of a run with the seed seeds[r]
+    def __init__(self, seeds, noThieves):
+        self.seeds = seeds
+        self.generators = [ThiefRandom.ThiefRandom(seed) for seed in seeds]
+        self.noThieves = noThieves
+
+    def uniforms(self, epoch, start, stop):
+        # Output:
+        #   the uniform random numbers of the stacked thieves start, start+1, ..., stop-1 at the given epoch
+        numbers = np.concatenate([generator.uniforms(epoch, 0, self.noThieves) for generator in self.generators])
+        return numbers[start:stop]
+
+
+class ReplicaResult:
+    # the result of a replica run
+    #   nodeScores, edgeScores - (noReplicas, noNodes) and (noReplicas, noEdges) arrays with the scores of every replica (the
+    #                            meanVDiamonds and meanPassesEdges of GOTResult)
+    #   meanNodeScores, meanEdgeScores - the scores averaged over the replicas
+    #   nodeStdErrors, edgeStdErrors - the standard errors of the mean scores
+    #   nodeRanks, edgeRanks - the rank of every node and edge in every replica (0 for the most central one)
+    #   seeds - the seed of every replica
+    #   k - the number of epochs
+    __slots__ = ('csr', 'history', 'nodeScores', 'edgeScores', 'seeds', 'k', 'nodeRanksCache', 'edgeRanksCache')
+
+    def __init__(self, csr, history, seeds, k):
+        self.csr = csr
+        self.history = history
+        self.nodeScores = history.meanVDiamonds().reshape(len(seeds), csr.noNodes)
+        self.edgeScores = history.meanPassesEdges().reshape(len(seeds), csr.noEdges)
+        self.seeds = seeds
+        self.k = k
+        self.nodeRanksCache = None
+        self.edgeRanksCache = None
+
+    @property
+    def noReplicas(self):
+        return len(self.seeds)
+
+    @property
+    def meanNodeScores(self):
+        return self.nodeScores.mean(axis=0)
+
+    @property
+    def meanEdgeScores(self):
+        return self.edgeScores.mean(axis=0)
+
+    @property
+    def nodeStdErrors(self):
+        return standardError(self.nodeScores)
+
+    @property
+    def edgeStdErrors(self):
+        return standardError(self.edgeScores)
+
+    @property
+    def nodeRanks(self):
+        if (self.nodeRanksCache is None):
+            self.nodeRanksCache = ranks(self.nodeScores)
+        return self.nodeRanksCache
+
+    @property
+    def edgeRanks(self):
+        if (self.edgeRanksCache is None):
+            self.edgeRanksCache = ranks(-self.edgeScores)
+        return self.edgeRanksCache
+
+    @property
+    def sortedNodes(self):
+        # all nodes (labels) sorted according with their mean centrality, from the most important ones to the least important ones
+        return self.csr.toLabels(self.meanNodeScores.argsort(axis=0))
+
+    @property
+    def sortedEdges(self):
+        # the edges sorted according with their mean centrality, in the format of GOTResult.sortedEdges
+        return self.csr.rankedEdges(self.meanEdgeScores.argsort(axis=0)[::-1])
+
+    @property
+    def vdiamonds(self):
+        # the (noReplicas, noNodes, epochs) vdiamonds history of the replicas (or what the history mode keeps of it)
+        vdiamonds = self.history.vdiamonds()
+        if (vdiamonds is None):
+            return None
+        return vdiamonds.reshape(self.noReplicas, self.csr.noNodes, vdiamonds.shape[1])
+
+    def rankStability(self, topK=None):
+        # Output:
+        #   a dict with the rank stability of the nodes and of the edges over the replicas:
+        #   'nodeRankStd', 'edgeRankStd' - the standard deviation of the rank of every node and edge
+        #   'nodeSpearman', 'edgeSpearman' - the mean Spearman correlation of the rankings of two replicas
+        #   'nodeTopK', 'edgeTopK' - the mean overlap (fraction) of the topK most central nodes and edges of two replicas
+        #                            (only if topK is given)
+        stability = {'nodeRankStd': self.nodeRanks.std(axis=0), 'edgeRankStd': self.edgeRanks.std(axis=0),
+                     'nodeSpearman': meanPairwise(np.corrcoef(self.nodeRanks)), 'edgeSpearman': meanPairwise(np.corrcoef(self.edgeRanks))}
+        if (topK is not None):
+            stability['nodeTopK'] = topOverlap(self.nodeRanks, topK)
+            stability['edgeTopK'] = topOverlap(self.edgeRanks, topK)
+        return stability
+
+
+def standardError(scores):
+    if (scores.shape[0] < 2):
+        return np.zeros(scores.shape[1])
+    return scores.std(axis=0, ddof=1) / np.sqrt(scores.shape[0])
+
+def ranks(scores):
+    # the rank of every column in every row of scores (0 for the smallest value, the ties in the order of the columns)
+    order = scores.argsort(axis=1, kind='mergesort')
+    result = np.empty_like(order)
+    np.put_along_axis(result, order, np.arange(scores.shape[1])[None, :].repeat(scores.shape[0], axis=0), axis=1)
+    return result
+
+def meanPairwise(matrix):
+    # the mean of the off-diagonal elements of a square matrix (1 for a single replica)
+    n = np.atleast_2d(matrix).shape[0]
+    if (n < 2):
+        return 1.0
+    return float((matrix.sum() - np.trace(matrix)) / (n * (n - 1)))
+
+def topOverlap(rankMatrix, topK):
+    # the mean overlap of the topK sets of two rows of rankMatrix
+    top = (rankMatrix < topK).astype(np.float64)
+    return meanPairwise(top.dot(top.T) / float(min(topK, rankMatrix.shape[1])))
+
+
+def ComputeCentrality(G, noThiefs, noVDiamonds, noEpochs, noReplicas=10, seed=None, historyMode='mean', historyLength=100, historyEvery=10,
+                      historyFile=None, progressCallback=None, progressEvery=100):
+    # noReplicas independent runs of GOT in one pass
+    # Input:
+    #   G, noThiefs, noVDiamonds, noEpochs - the same as for VectorizedGOT.ComputeCentrality (every replica runs noEpochs epochs)
+    #   noReplicas - number of replicas (default 10)
+    #   seed - replica r uses the seed seed + r (default None, a random seed)
+    #   historyMode, historyLength, historyEvery, historyFile - the same as for GOT.ComputeCentrality, for the vdiamonds of all
+    #                                                        replicas (default 'mean', only the scores are kept)
+    #   progressCallback, progressEvery - the same as for GOT.ComputeCentrality (the statistics are over all replicas)
+    # Output:
+    #   a ReplicaResult, with the scores of every replica, their means, standard errors and rank stability
+    graph = GraphAdapter.GraphAdapter(G, noVDiamonds)
+    csr = graph.csr
+    replicaGraph = ReplicaGraph(csr, noReplicas)
+    if (seed is None):
+        seed = ThiefRandom.ThiefRandom().seed
+    seeds = [(int(seed) + r) % (2 ** 64) for r in range(noReplicas)]
+
+    # the stacked counters and the stacked thieves (the thieves of replica r are after the ones of replica r-1)
+    vdiamonds = np.tile(graph.vdiamonds, noReplicas)
+    thiefsPasses = np.zeros(replicaGraph.noEdges, dtype=np.int64)
+    origins = np.repeat(np.flatnonzero(csr.degrees > 0), noThiefs)
+    thieves = VectorizedGOT.ThiefPopulation((origins[None, :] + csr.noNodes * np.arange(noReplicas)[:, None]).ravel(), replicaGraph.indexType)
+    thiefRandom = ReplicaRandom(seeds, origins.shape[0])
+    history = History.EpochHistory(replicaGraph.noNodes, replicaGraph.noEdges, noEpochs, historyMode, historyLength, historyEvery, historyFile)
+
+    monitor = Progress.createMonitor(progressCallback, progressEvery, noEpochs)
+    k = 0
+    while (k < noEpochs):
+        k += 1
+        if (monitor is not None):
+            monitor.tic()
+
+        # one step of the thieves of all replicas (in the first epoch the thieves are only created)
+        if (k > 1):
+            thieves.Move(replicaGraph, vdiamonds, thiefsPasses, thiefRandom, k)
+        if (monitor is not None):
+            monitor.toc('move')
+
+        history.record(vdiamonds, thiefsPasses)
+        if (monitor is not None):
+            monitor.toc('history')
+            if (monitor.due(k) and VectorizedGOT.reportProgress(monitor, k, thieves, None)):
+                break
+    if (monitor is not None):
+        VectorizedGOT.reportProgress(monitor, k, thieves, None, True)
+
+    return ReplicaResult(csr, history, seeds, k)
@@ -1,6 +1,6 @@
 # Author: Decebal Constantin Mocanu;
 # Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
-# This is a pre-alpha free software and was tested with Python 2.7.12, Matplotlib 2.1.0, Numpy 1.14, NetworkX 2.0;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
 # The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
 # For an easy understanding of the code functionality please read the following article.
 
@@ -15,75 +15,74 @@
 #  url =           {https://www.nature.com/articles/s41598-018-19356-4}
 #}
 
-import numpy as np
 import random as rd
+from array import array
 
 class Thief:
     # this is the basic implementation of a thief behaviour
+    # the path is a compact array of node indices plus a map from each node on the path to its first index in the path,
+    # so that cutting a cycle from the path and stepping back are O(1) (amortized), whatever the length of the path
+    __slots__ = ('origin', 'position', 'diamond', 'path', 'pathIndex')
+
     def __init__(self, origin):
         self.origin = origin
         self.position = origin
         self.diamond=0
-        self.path=[]
+        self.path=array('l')
+        self.pathIndex={}
         
-    def Move(self,G,k):
+    def Move(self,graph,k,rdProb=None):
+        # graph - the GraphAdapter of the network, which holds the vdiamonds and thieves passes counters
+        # rdProb - the uniform random number used to choose the next node (default None, drawn from the random module)
         if (self.diamond==0):
-            self.Search(G)
+            self.Search(graph,rdProb)
             if (self.position!=self.origin):
-                self.TakeDiamond(G)
+                self.TakeDiamond(graph)
         else:
-            self.Back(G,k)
+            self.Back(graph,k)
             
-    def Search(self,G):
-        neighboursList = G[self.position]
-        moveProb=np.zeros(len(neighboursList))
-        sumWeights=0
-        for neighbour in neighboursList:
-            sumWeights+=G.edges[self.position,neighbour]['value']
-
-        i=0
-        for neighbour in neighboursList:
-            moveProb[i]=(float)(G.edges[self.position,neighbour]['value'])/sumWeights
-            i+=1
-
-        rdProb=rd.random()
-        sumProb=0
-        i = 0
-        for neighbour in neighboursList:
-            sumProb+=moveProb[i]
-            if (sumProb>=rdProb):
-                moveTo=neighbour
-                break
-            i += 1
-        try: 
-            index=self.path.index(moveTo)
-        except ValueError:
-            index=-1
-
+    def Search(self,graph,rdProb=None):
+        if (rdProb is None):
+            rdProb=rd.random()
+        moveTo=graph.SampleNeighbour(self.position,rdProb)
+        index=self.pathIndex.get(moveTo,-1)
         if (index>-1):
-            for i in range(index+1,len(self.path)):
-                del self.path[-1]
+            self.CutPath(index+1)
 
-        self.path.append(self.position)
+        self.AppendPath(self.position)
         self.position=moveTo
         if (self.origin==self.position):  
-            self.path=[]   
+            self.ClearPath()
+
+    def AppendPath(self,node):
+        if (node not in self.pathIndex):
+            self.pathIndex[node]=len(self.path)
+        self.path.append(node)
+
+    def CutPath(self,length):
+        # keep only the first length nodes of the path
+        for i in range(len(self.path)-1,length-1,-1):
+            if (self.pathIndex[self.path[i]]==i):
+                del self.pathIndex[self.path[i]]
+        del self.path[length:]
+
+    def ClearPath(self):
+        del self.path[:]
+        self.pathIndex.clear()
 
-    def TakeDiamond(self,G):
-        if (G.node[self.position]['vdiamonds']>0):
-            G.node[self.position]['vdiamonds']-=1
+    def TakeDiamond(self,graph):
+        if (graph.vdiamonds[self.position]>0):
+            graph.vdiamonds[self.position]-=1
             self.diamond=1
         
-    def Back(self,G,epo):
-        currentEdge=G.get_edge_data(self.position,self.path[-1])
-        thiefsPasses=currentEdge['thiefsPasses']+1
-        G.add_edge(self.position,self.path[-1],thiefsPasses=thiefsPasses)
+    def Back(self,graph,epo):
+        graph.thiefsPasses[graph.EdgeId(self.position,self.path[-1])]+=1
 
         self.position=self.path[-1]
-        del self.path[-1]
+        self.CutPath(len(self.path)-1)
         if (self.position==self.origin):
-            self.path=[]
+            self.ClearPath()
             self.diamond=0
             self.position=self.origin
-            G.node[self.position]['vdiamonds']+=1
+            graph.vdiamonds[self.position]+=1
 
@@ -0,0 +1,37 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+import random
+import numpy as np
+
+class ThiefRandom:
+    # counter-based random numbers for the thieves (NumPy's Philox): the number drawn by thief t at epoch k depends only on
+    # (seed, k, t), so a run gives bit-identical results whatever the number of workers or the order in which the thieves
+    # are processed, and it can be resumed at any epoch
+    # Input:
+    #   seed - an integer in [0, 2**64); None draws a random seed (kept in self.seed, so that the run can be repeated)
+    def __init__(self, seed=None):
+        if (seed is None):
+            seed = random.SystemRandom().getrandbits(64)
+        self.seed = int(seed) % (2 ** 64)
+
+    def uniforms(self, epoch, start, stop):
+        # Output:
+        #   the uniform random numbers in [0,1) of the thieves start, start+1, ..., stop-1 at the given epoch
+        # The key of the generator is (seed, epoch) and its counter is the thief index (Philox gives 4 numbers per counter value)
+        bitGenerator = np.random.Philox(key=(int(epoch) << 64) + self.seed, counter=start // 4)
+        return np.random.Generator(bitGenerator).random(stop - start + start % 4)[start % 4:]
@@ -0,0 +1,285 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the code functionality please read the following article.
+
+# If you use this code please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+import numpy as np
+import GraphAdapter
+import Convergence
+import History
+import GOTResult
+import ThiefRandom
+import Checkpoint
+import Progress
+
+class ThiefPopulation:
+    # all thieves of a GOT run stored as flat arrays, so that one epoch advances every thief with a few NumPy operations
+    #   origin, position - the home node and the current node of each thief
+    #   diamond - 1 if the thief carries a vdiamond back home, 0 if it is searching
+    #   pathNodes, pathEdges, pathLen - the path of each thief (same semantics as Thief.path); pathEdges[t, j] is the
+    #                                   edge between pathNodes[t, j] and the next node on the path (or the current position)
+    #   firstThief - the global index of the first thief (when the thieves of a run are split in several populations)
+    def __init__(self, origins, indexType, firstThief=0, initialPathWidth=8):
+        noThieves = origins.shape[0]
+        self.firstThief = firstThief
+        self.origin = origins.astype(indexType)
+        self.position = self.origin.copy()
+        self.diamond = np.zeros(noThieves, dtype=np.int8)
+        self.pathNodes = np.zeros((noThieves, initialPathWidth), dtype=indexType)
+        self.pathEdges = np.zeros((noThieves, initialPathWidth), dtype=indexType)
+        self.pathLen = np.zeros(noThieves, dtype=np.int64)
+
+    def ensurePathWidth(self, width):
+        # grow the path buffers (by doubling) when a thief walks further than the current width
+        if (width > self.pathNodes.shape[1]):
+            newWidth = self.pathNodes.shape[1]
+            while (newWidth < width):
+                newWidth *= 2
+            extra = newWidth - self.pathNodes.shape[1]
+            self.pathNodes = np.pad(self.pathNodes, ((0, 0), (0, extra)), mode='constant')
+            self.pathEdges = np.pad(self.pathEdges, ((0, 0), (0, extra)), mode='constant')
+
+    def getState(self):
+        # Output:
+        #   a copy of the thieves (for the checkpoints); the path buffers are cut to the longest path
+        width = max(int(self.pathLen.max(initial=0)), 1)
+        return {'firstThief': self.firstThief, 'origin': self.origin.copy(), 'position': self.position.copy(),
+                'diamond': self.diamond.copy(), 'pathNodes': self.pathNodes[:, :width].copy(),
+                'pathEdges': self.pathEdges[:, :width].copy(), 'pathLen': self.pathLen.copy()}
+
+    def setState(self, state):
+        self.firstThief = state['firstThief']
+        self.origin = state['origin'].copy()
+        self.position = state['position'].copy()
+        self.diamond = state['diamond'].copy()
+        self.pathNodes = state['pathNodes'].copy()
+        self.pathEdges = state['pathEdges'].copy()
+        self.pathLen = state['pathLen'].copy()
+
+    def Move(self, csr, vdiamonds, thiefsPasses, thiefRandom, epoch):
+        # make a move for each thief
+        # Input:
+        #   csr - the CSRGraph on which the thieves live
+        #   vdiamonds - the amount of vdiamonds per node (updated in place)
+        #   thiefsPasses - the number of thieves passes per edge (updated in place)
+        #   thiefRandom - the ThiefRandom of the run
+        #   epoch - the current epoch
+        # Within an epoch the thieves carrying a vdiamond step back first; afterwards the searching thieves move and
+        # the vdiamonds available in a node are given to the thieves which arrived there in the order of their index.
+        searching = np.flatnonzero(self.diamond == 0)
+        self.Back(vdiamonds, thiefsPasses)
+        if (searching.shape[0] > 0):
+            moveTo = self.Search(csr, searching, self.uniforms(thiefRandom, epoch)[searching])
+            self.TakeDiamond(vdiamonds, searching[moveTo != self.origin[searching]])
+
+    def uniforms(self, thiefRandom, epoch):
+        # the random numbers of all thieves of the population at the given epoch
+        return thiefRandom.uniforms(epoch, self.firstThief, self.firstThief + self.origin.shape[0])
+
+    def Search(self, csr, searching, rdProb):
+        position = self.position[searching]
+        [moveTo, edgeIds] = csr.sampleNeighbours(position, rdProb)
+
+        # look for the new node in the path of each thief; if it is found the path is cut after it
+        pathLen = self.pathLen[searching]
+        maxLen = pathLen.max()
+        if (maxLen > 0):
+            match = (self.pathNodes[searching, :maxLen] == moveTo[:, None]) & (np.arange(maxLen) < pathLen[:, None])
+            found = match.any(axis=1)
+            index = match.argmax(axis=1)
+        else:
+            found = np.zeros(searching.shape[0], dtype=bool)
+            index = np.zeros(searching.shape[0], dtype=np.int64)
+        newLen = np.where(found, index + 2, pathLen + 1)
+        self.ensurePathWidth(newLen.max())
+
+        # append the current position to the path
+        self.pathNodes[searching, newLen - 1] = position
+        self.pathEdges[searching, newLen - 1] = edgeIds
+        cut = searching[found]
+        self.pathEdges[cut, index[found]] = edgeIds[found]
+        self.pathLen[searching] = newLen
+
+        # a thief which arrives home forgets its path
+        self.position[searching] = moveTo
+        self.pathLen[searching[moveTo == self.origin[searching]]] = 0
+        return moveTo
+
+    def TakeDiamond(self, vdiamonds, takers):
+        if (takers.shape[0] == 0):
+            return
+        nodes = self.position[takers]
+        order = np.argsort(nodes, kind='mergesort')
+        nodes = nodes[order]
+        takers = takers[order]
+        groupStart = np.flatnonzero(np.concatenate(([True], nodes[1:] != nodes[:-1])))
+        groupSize = np.diff(np.concatenate((groupStart, [nodes.shape[0]])))
+        rank = np.arange(nodes.shape[0]) - np.repeat(groupStart, groupSize)
+        granted = rank < vdiamonds[nodes]
+        vdiamonds -= np.bincount(nodes[granted], minlength=vdiamonds.shape[0]).astype(vdiamonds.dtype)
+        self.diamond[takers[granted]] = 1
+
+    def Back(self, vdiamonds, thiefsPasses):
+        returning = np.flatnonzero(self.diamond == 1)
+        if (returning.shape[0] == 0):
+            return
+        last = self.pathLen[returning] - 1
+        edgeIds = self.pathEdges[returning, last]
+        thiefsPasses += np.bincount(edgeIds, minlength=thiefsPasses.shape[0]).astype(thiefsPasses.dtype)
+        self.position[returning] = self.pathNodes[returning, last]
+        self.pathLen[returning] = last
+
+        # the thieves arrived home drop their vdiamond
+        arrived = returning[last == 0]
+        self.diamond[arrived] = 0
+        vdiamonds += np.bincount(self.origin[arrived], minlength=vdiamonds.shape[0]).astype(vdiamonds.dtype)
+
+
+def ComputeCentrality(G, noThiefs, noVDiamonds, noEpochs, untilConvergence=False, noLastEuclidDists=10, convergenceStride=10, topK=None,
+                      historyMode='full', historyLength=100, historyEvery=10, historyFile=None, writeBack=False, seed=None,
+                      checkpointFile=None, checkpointEvery=None, checkpointSeconds=None, progressCallback=None, progressEvery=100):
+    # This is the vectorized version of GOT; the graph is converted once into a CSR adjacency and all thieves are moved together
+    # Input and output are the same as for GOT.ComputeCentrality
+    #   G - network to be analyzed (a NetworkX graph or a CSRGraph)
+    #   convergenceStride - the stopping criteria is checked every convergenceStride epochs (default 10, see GOT.ComputeCentrality)
+    #   seed - seed of the counter-based random numbers of the thieves (default None, a different run each time); with
+    #          the same seed the run is bit-identical to ParallelGOT.ComputeCentrality, whatever the number of workers
+    #   checkpointFile - if given, the whole state of the run is saved in this .npz file every checkpointEvery epochs and/or
+    #                    every checkpointSeconds seconds (by a background thread); an interrupted run is continued with
+    #                    ResumeCentrality (default None, no checkpoints)
+    #   progressCallback, progressEvery - the same as for GOT.ComputeCentrality
+    thiefRandom = ThiefRandom.ThiefRandom(seed)
+
+    # initialize GOT parameters on the graph (the counters are kept in the adapter, not in the graph attributes)
+    graph = GraphAdapter.GraphAdapter(G, noVDiamonds)
+
+    parameters = {'noThiefs': noThiefs, 'noVDiamonds': noVDiamonds, 'noEpochs': noEpochs, 'untilConvergence': untilConvergence,
+                  'noLastEuclidDists': noLastEuclidDists, 'convergenceStride': convergenceStride, 'topK': topK or 0, 'historyMode': historyMode,
+                  'historyLength': historyLength, 'historyEvery': historyEvery, 'historyFile': historyFile or '',
+                  'checkpointEvery': checkpointEvery or 0, 'checkpointSeconds': checkpointSeconds or 0}
+    history = History.EpochHistory(graph.noNodes, graph.noEdges, noEpochs, historyMode, historyLength, historyEvery, historyFile)
+    convergence = Convergence.createCheck(graph.noNodes, noLastEuclidDists, convergenceStride, topK)
+
+    # the thieves of each node (they start moving in the second epoch)
+    thieves = ThiefPopulation(np.repeat(np.flatnonzero(graph.csr.degrees > 0), noThiefs), graph.csr.indexType)
+    monitor = Progress.createMonitor(progressCallback, progressEvery, noEpochs)
+    return runEpochs(graph, thieves, history, convergence, thiefRandom, 0, parameters, writeBack, checkpointFile, monitor)
+
+
+def ResumeCentrality(G, checkpointFile, noEpochs=None, writeBack=False, checkpointEvery=None, checkpointSeconds=None, progressCallback=None,
+                     progressEvery=100):
+    # Continue a run of ComputeCentrality from its last checkpoint; the trajectory is exactly the one of the uninterrupted run
+    # Input:
+    #   G - the network on which the run was started
+    #   checkpointFile - the checkpoint file of the run (it is updated as the resumed run goes on)
+    #   noEpochs - the total number of epochs (default None, the one of the interrupted run; it can be increased to extend a
+    #              run, except with the 'memmap' history)
+    #   writeBack - the same as for ComputeCentrality
+    #   checkpointEvery, checkpointSeconds - how often the state is saved (default None, as in the interrupted run)
+    #   progressCallback, progressEvery - the same as for GOT.ComputeCentrality
+    # Output:
+    #   the same as ComputeCentrality
+    state = Checkpoint.load(checkpointFile)
+    parameters = Checkpoint.stripPrefix('parameters.', state)
+    if (noEpochs is not None):
+        parameters['noEpochs'] = noEpochs
+    if (checkpointEvery is not None or checkpointSeconds is not None):
+        parameters['checkpointEvery'] = checkpointEvery or 0
+        parameters['checkpointSeconds'] = checkpointSeconds or 0
+
+    graph = GraphAdapter.GraphAdapter(G, parameters['noVDiamonds'])
+    if (Checkpoint.graphFingerprint(graph.csr) != state['graphFingerprint']):
+        raise ValueError("the checkpoint " + str(checkpointFile) + " was taken on a different graph")
+    graph.vdiamonds[:] = state['vdiamonds']
+    graph.thiefsPasses[:] = state['thiefsPasses']
+
+    history = History.EpochHistory(graph.noNodes, graph.noEdges, parameters['noEpochs'], parameters['historyMode'], parameters['historyLength'],
+                                   parameters['historyEvery'], parameters['historyFile'] or None, resume=True)
+    history.setState(Checkpoint.stripPrefix('history.', state))
+    convergence = Convergence.createCheck(graph.noNodes, parameters['noLastEuclidDists'], parameters['convergenceStride'], parameters.get('topK'))
+    convergence.setState(Checkpoint.stripPrefix('convergence.', state))
+    thieves = ThiefPopulation(np.zeros(0, dtype=np.int64), graph.csr.indexType)
+    thieves.setState(Checkpoint.stripPrefix('thieves.', state))
+    monitor = Progress.createMonitor(progressCallback, progressEvery, parameters['noEpochs'])
+    return runEpochs(graph, thieves, history, convergence, ThiefRandom.ThiefRandom(state['seed']), state['k'], parameters, writeBack, checkpointFile, monitor)
+
+
+def reportProgress(monitor, k, thieves, convergence, final=False):
+    # call the progress hook (see Progress.ProgressMonitor) with the state of the thieves at epoch k
+    return monitor.report(k, np.count_nonzero(thieves.diamond), thieves.pathLen.mean() if thieves.pathLen.shape[0] > 0 else 0.0,
+                          None if convergence is None else float(convergence.euclidDist), final)
+
+def runEpochs(graph, thieves, history, convergence, thiefRandom, k, parameters, writeBack, checkpointFile, monitor=None):
+    # the epoch loop of ComputeCentrality and ResumeCentrality, starting after epoch k; thieves, the counters of graph, history
+    # and convergence are updated in place; monitor is the progress hook (None: the loop is not instrumented)
+    csr = graph.csr
+    vdiamonds = graph.vdiamonds
+    thiefsPasses = graph.thiefsPasses
+    noEpochs = parameters['noEpochs']
+
+    checkpoint = None
+    if (checkpointFile is not None and (parameters['checkpointEvery'] or parameters['checkpointSeconds'])):
+        checkpoint = Checkpoint.CheckpointWriter(checkpointFile, parameters['checkpointEvery'] or None, parameters['checkpointSeconds'] or None)
+        fingerprint = Checkpoint.graphFingerprint(csr)
+
+    # run GOT for a specific number of epochs or until convergence
+    checkConvergence = parameters['untilConvergence'] or parameters.get('topK')
+    try:
+        while (k < noEpochs):
+            k += 1
+            if (monitor is not None):
+                monitor.tic()
+
+            # make a move for each thief (in the first epoch the thieves are only created)
+            if (k > 1):
+                thieves.Move(csr, vdiamonds, thiefsPasses, thiefRandom, k)
+            if (monitor is not None):
+                monitor.toc('move')
+
+            # store the amount of vdiamonds from each node and the number of thieves passes on each edge at epoch k
+            history.record(vdiamonds, thiefsPasses)
+            if (monitor is not None):
+                monitor.toc('history')
+
+            if (checkConvergence and convergence.update(vdiamonds)):
+                break
+            if (monitor is not None):
+                monitor.toc('convergence')
+
+            # save the state at the end of epoch k (copied here, written in the background)
+            if (checkpoint is not None and checkpoint.due(k)):
+                state = {'k': k, 'seed': thiefRandom.seed, 'graphFingerprint': fingerprint,
+                         'vdiamonds': vdiamonds.copy(), 'thiefsPasses': thiefsPasses.copy()}
+                state.update(Checkpoint.withPrefix('parameters.', parameters))
+                state.update(Checkpoint.withPrefix('thieves.', thieves.getState()))
+                state.update(Checkpoint.withPrefix('history.', history.getState()))
+                state.update(Checkpoint.withPrefix('convergence.', convergence.getState()))
+                checkpoint.submit(state)
+            if (monitor is not None):
+                monitor.toc('checkpoint')
+                if (monitor.due(k) and reportProgress(monitor, k, thieves, convergence if checkConvergence else None)):
+                    break
+    finally:
+        if (checkpoint is not None):
+            checkpoint.close()
+    if (monitor is not None):
+        reportProgress(monitor, k, thieves, convergence if checkConvergence else None, True)
+
+    # write the final counters in the graph attributes only if it is requested
+    if (writeBack):
+        graph.writeBack()
+
+    # the rankings and the history are computed from the history only when they are used
+    return GOTResult.GOTResult(csr, history, k)
@@ -0,0 +1,199 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The software is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the software functionality please read the following article.
+
+# If you use this software please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+# Benchmark of the GOT engines and of the removal procedures over the three network families of library and several sizes.
+# Every case runs in a fresh process, so that its peak memory (RSS) is not mixed with the one of the other cases; it still
+# includes the generation of the network and its conversion to NetworkX, whose peak is reported apart (setupPeakRSSMB), so
+# only a peakRSSMB above setupPeakRSSMB is due to the measured part. The results are saved as JSON and
+# can be compared with a stored baseline (the script exits with status 1 if a case is slower than the baseline by more
+# than the tolerance).
+#
+# Examples:
+#   python benchmark_GOT.py --sizes 1000 10000 --output results.json
+#   python benchmark_GOT.py --sizes 1000 10000 --baseline results.json --tolerance 0.2
+#   python benchmark_GOT.py --sizes 1000 10000 100000 1000000 --cases VectorizedGOT ParallelGOT --workers 4
+
+import argparse
+import datetime
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+import numpy as np
+import networkx as nx
+
+caseNames = ['VectorizedGOT', 'VectorizedGOT-convergence', 'ParallelGOT', 'GOT', 'GOT-convergence', 'ThiefMove', 'nodesRemoval', 'edgesRemoval']
+# the cases which need a NetworkX graph (they are skipped above --max-networkx-nodes)
+networkXCases = ['GOT', 'GOT-convergence', 'ThiefMove', 'nodesRemoval', 'edgesRemoval']
+
+def peakRSS():
+    # the peak resident memory in MB of the current process or of the largest of its finished children (the ParallelGOT
+    # workers); ru_maxrss is in KB on Linux and in bytes on macOS
+    maxRSS = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return maxRSS / (1024.0 * 1024.0) if sys.platform == 'darwin' else maxRSS / 1024.0
+
+def toNetworkX(csr):
+    import library
+    G = nx.Graph()
+    G.add_nodes_from(range(csr.noNodes))
+    G.add_edges_from(csr.edges.tolist())
+    return library.generateUnweightedNetwork(G)
+
+def runCase(case, family, N, options):
+    # run one case in the current (fresh) process
+    # Output:
+    #   a dict with the measures of the case
+    import library, GOT, VectorizedGOT, ParallelGOT, GraphAdapter, Thief, ThiefRandom
+    t0 = time.perf_counter()
+    csr = library.generateNetworkCSR(N, family, False, seed=options['seed'])
+    G = toNetworkX(csr) if case in networkXCases else None
+    # generateNetworkCSR keeps only the giant component, so the network can have fewer nodes than the requested N
+    noNodes = csr.noNodes
+    measures = {'case': case, 'family': family, 'requestedNodes': N, 'nodes': noNodes, 'edges': int(csr.noEdges),
+                'generationTime': time.perf_counter() - t0, 'setupPeakRSSMB': peakRSS()}
+    noThieves = int(np.count_nonzero(csr.degrees > 0)) * options['thieves']
+    noEpochs = options['epochs']
+
+    # the fastest of several repetitions (the setup of a repetition is not timed)
+    wallTime = float('inf')
+    for repeat in range(options['repeats']):
+        t1 = time.perf_counter()
+        if (case in ['VectorizedGOT', 'VectorizedGOT-convergence', 'ParallelGOT', 'GOT', 'GOT-convergence']):
+            untilConvergence = case.endswith('-convergence')
+            maxEpochs = options['maxEpochs'] if untilConvergence else noEpochs
+            arguments = dict(untilConvergence=untilConvergence, historyMode='mean', seed=options['seed'])
+            if (case == 'ParallelGOT'):
+                result = ParallelGOT.ComputeCentrality(csr, options['thieves'], noNodes, maxEpochs, noWorkers=options['workers'], **arguments)
+            elif (case.startswith('GOT')):
+                result = GOT.ComputeCentrality(G, options['thieves'], noNodes, maxEpochs, **arguments)
+            else:
+                result = VectorizedGOT.ComputeCentrality(csr, options['thieves'], noNodes, maxEpochs, **arguments)
+            measures['epochs'] = result.k
+        elif (case == 'ThiefMove'):
+            # only the moves of the thieves of the reference engine, without the history and the convergence check
+            graph = GraphAdapter.GraphAdapter(G, noNodes)
+            thieves = [Thief.Thief(i) for i in range(noNodes) if csr.degrees[i] > 0 for j in range(options['thieves'])]
+            thiefRandom = ThiefRandom.ThiefRandom(options['seed'])
+            rdProbs = [thiefRandom.uniforms(k, 0, len(thieves)).tolist() for k in range(2, noEpochs + 1)]
+            t1 = time.perf_counter()
+            for k in range(2, noEpochs + 1):
+                probs = rdProbs[k - 2]
+                for i in range(len(thieves)):
+                    thieves[i].Move(graph, k, probs[i])
+            measures['epochs'] = noEpochs
+        elif (case == 'nodesRemoval'):
+            order = np.random.RandomState(options['seed']).permutation(noNodes)
+            library.nodesRemovalProcedure(G, order)
+        elif (case == 'edgesRemoval'):
+            order = csr.edges[np.random.RandomState(options['seed']).permutation(csr.noEdges)]
+            library.edgesRemovalProcedure(G, order)
+        wallTime = min(wallTime, time.perf_counter() - t1)
+
+    measures['wallTime'] = wallTime
+    if ('epochs' in measures):
+        # the thieves are created in the first epoch and move in the next ones
+        measures['epochsPerSec'] = measures['epochs'] / wallTime
+        measures['thiefStepsPerSec'] = noThieves * max(measures['epochs'] - 1, 0) / wallTime
+    measures['peakRSSMB'] = peakRSS()
+    return measures
+
+def caseProcess(queue, case, family, N, options):
+    try:
+        queue.put(runCase(case, family, N, options))
+    except Exception:
+        import traceback
+        queue.put(traceback.format_exc())
+
+def caseKey(measures):
+    # the cases are identified by the requested number of nodes (the generated network may be slightly smaller)
+    return '%s/%s/%d' % (measures['case'], measures['family'], measures.get('requestedNodes', measures['nodes']))
+
+def compareWithBaseline(results, baseline, tolerance):
+    # Output:
+    #   the list of the keys of the cases slower than in the baseline by more than tolerance (relative wall time)
+    baselineCases = dict((caseKey(measures), measures) for measures in baseline['results'])
+    regressions = []
+    print("\n%-45s %12s %12s %8s" % ("case", "baseline (s)", "now (s)", "ratio"))
+    for measures in results:
+        key = caseKey(measures)
+        if (key not in baselineCases):
+            continue
+        ratio = measures['wallTime'] / max(baselineCases[key]['wallTime'], 1e-9)
+        flag = ""
+        if (ratio > 1 + tolerance):
+            flag = "  REGRESSION"
+            regressions.append(key)
+        print("%-45s %12.4f %12.4f %8.2f%s" % (key, baselineCases[key]['wallTime'], measures['wallTime'], ratio, flag))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark of the GOT engines and of the removal procedures")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000], help="numbers of nodes (default 1000 10000)")
+    parser.add_argument('--families', nargs='+', default=["scale-free", "small-world", "Erdos-Renyi"], help="network types")
+    parser.add_argument('--cases', nargs='+', default=caseNames, choices=caseNames, help="what is measured (default all)")
+    parser.add_argument('--epochs', type=int, default=50, help="number of epochs of the fixed length runs (default 50)")
+    parser.add_argument('--max-epochs', type=int, default=1000, help="maximum number of epochs of the convergence runs (default 1000)")
+    parser.add_argument('--thieves', type=int, default=1, help="number of thieves per node (default 1)")
+    parser.add_argument('--workers', type=int, default=2, help="number of ParallelGOT workers (default 2)")
+    parser.add_argument('--max-networkx-nodes', type=int, default=10000, help="largest network for the cases on NetworkX graphs (default 10000)")
+    parser.add_argument('--repeats', type=int, default=3, help="the fastest of this many runs is reported (default 3)")
+    parser.add_argument('--seed', type=int, default=2018)
+    parser.add_argument('--output', help="JSON file where the results are saved")
+    parser.add_argument('--baseline', help="JSON file of a previous run to compare with")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="allowed relative slowdown against the baseline (default 0.2)")
+    args = parser.parse_args()
+
+    options = {'seed': args.seed, 'epochs': args.epochs, 'maxEpochs': args.max_epochs, 'thieves': args.thieves, 'workers': args.workers, 'repeats': args.repeats}
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for N in args.sizes:
+        for family in args.families:
+            for case in args.cases:
+                if (case in networkXCases and N > args.max_networkx_nodes):
+                    continue
+                # a new process per case, so that the peak RSS is not the one of a previous case
+                queue = context.Queue()
+                process = context.Process(target=caseProcess, args=(queue, case, family, N, options))
+                process.start()
+                measures = queue.get()
+                process.join()
+                if (not isinstance(measures, dict)):
+                    raise RuntimeError("the case %s/%s/%d failed:\n%s" % (case, family, N, measures))
+                results.append(measures)
+                print("%-45s %10.4f s%s  peak RSS %8.1f MB (setup %8.1f MB)" % (caseKey(measures), measures['wallTime'],
+                      "  %10.1f epochs/s %14.1f thief steps/s" % (measures['epochsPerSec'], measures['thiefStepsPerSec']) if 'epochs' in measures else "",
+                      measures['peakRSSMB'], measures['setupPeakRSSMB']))
+
+    report = {'meta': {'date': datetime.datetime.now().isoformat(), 'python': platform.python_version(), 'numpy': np.__version__,
+                       'networkx': nx.__version__, 'platform': platform.platform(), 'cpus': multiprocessing.cpu_count(), 'options': vars(args)},
+              'results': results}
+    if (args.output):
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if (args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compareWithBaseline(results, baseline, args.tolerance)
+        if (len(regressions) > 0):
+            print("\n%d case(s) slower than the baseline by more than %d%%" % (len(regressions), 100 * args.tolerance))
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
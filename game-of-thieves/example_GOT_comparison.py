@@ -0,0 +1,40 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The software is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the software functionality please read the following article.
+
+# If you use this software please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+# Head-to-head comparison of GOT with the betweenness centrality on a large random network (see Comparison.py): the baseline
+# is the k-pivot betweenness spread over several processes, and the time of every stage is reported next to the one of GOT.
+
+import numpy as np
+import library, Comparison
+
+# set GOT parameters
+N=10000 #number of nodes
+noThieves=1 #number of thieves per node
+noVDiamonds=N #number of vdiamonds per node
+noEpochs=int(np.power(np.log(N),3)) #number of epochs
+
+# set the betweenness parameters
+noPivots=100 #number of sampled sources of the shortest paths
+noProcesses=4 #number of processes of the betweenness and of the removal procedures
+seed=2018
+
+G = library.generateNetwork(N, "scale-free", False, seed=seed)
+print("Generated a scale-free network with %d nodes and %d edges." % (G.number_of_nodes(), G.number_of_edges()))
+
+comparison = Comparison.compareCentralities(G, noThieves, noVDiamonds, noEpochs, noPivots=noPivots, noProcesses=noProcesses,
+                                            gotOptions={'historyMode': 'mean'}, seed=seed)
+print("\n".join(Comparison.report(comparison)))
@@ -1,6 +1,6 @@
 # Author: Decebal Constantin Mocanu;
 # Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
-# This is a pre-alpha free software and was tested with Python 2.7.12, Matplotlib 2.1.0, Numpy 1.14, NetworkX 2.0;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
 # The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
 # For an easy understanding of the code functionality please read the following article.
 
@@ -161,5 +161,5 @@ nx.draw_networkx_labels(G,posNodesOut,labels=getRank(vdiamonds,1000),font_size=f
 plt.savefig("GOT_illustration.pdf", bbox_inches='tight')
 plt.close()
 
-print "GOT illustration figure was made"
+print("GOT illustration figure was made")
 
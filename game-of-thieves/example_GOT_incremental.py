@@ -0,0 +1,68 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The software is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the software functionality please read the following article.
+
+# If you use this software please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+# GOT on an evolving network: after each batch of edge deletions and insertions the incremental run (IncrementalGOT) is
+# continued for a few epochs from its previous state, and its nodes ranking is compared with a cold start on the new network.
+
+import numpy as np
+import library, VectorizedGOT, IncrementalGOT
+import datetime
+
+def rankCorrelation(x, y):
+    # Spearman rank correlation between two score vectors
+    rx = np.zeros(x.shape[0])
+    ry = np.zeros(y.shape[0])
+    rx[x.argsort()] = np.arange(x.shape[0])
+    ry[y.argsort()] = np.arange(y.shape[0])
+    return np.corrcoef(rx, ry)[0, 1]
+
+# set GOT parameters
+N=3000 #number of nodes
+noThieves=1 #number of thieves per node
+noVDiamonds=N #number of vdiamonds per node
+noEpochs=100 #number of epochs of a cold start
+noWarmEpochs=20 #number of epochs after each change of the network
+noChanges=30 #number of edges removed and added in each batch
+seed=2018
+
+rng = np.random.RandomState(seed)
+G = library.generateNetwork(N, "scale-free", False, seed=seed)
+incremental = IncrementalGOT.IncrementalGOT(G, noThieves, noVDiamonds, seed=seed)
+incremental.run(noEpochs)
+
+for batch in range(5):
+    # remove some random edges and add some random new ones
+    edges = list(G.edges())
+    removed = [edges[i] for i in rng.choice(len(edges), noChanges, replace=False)]
+    G.remove_edges_from(removed)
+    added = []
+    while (len(added) < noChanges):
+        [u, v] = rng.randint(0, N, 2)
+        if (u != v and not G.has_edge(u, v)):
+            G.add_edge(int(u), int(v))
+            added.append((int(u), int(v)))
+    incremental.update(added, removed)
+
+    t1=datetime.datetime.now()
+    warm = incremental.run(noWarmEpochs)
+    t2=datetime.datetime.now()
+    cold = VectorizedGOT.ComputeCentrality(G, noThieves, noVDiamonds, noEpochs, seed=seed + batch + 1)
+    t3=datetime.datetime.now()
+    coldOtherSeed = VectorizedGOT.ComputeCentrality(G, noThieves, noVDiamonds, noEpochs, seed=seed + batch + 100)
+
+    print("Batch %d: warm start in %s, cold start in %s; nodes rank correlation warm vs cold %.4f, cold vs cold (other seed) %.4f"
+          % (batch, t2 - t1, t3 - t2, rankCorrelation(warm[0], cold[0]), rankCorrelation(coldOtherSeed[0], cold[0])))
@@ -0,0 +1,57 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The software is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the software functionality please read the following article.
+
+# If you use this software please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+# Validation report of the approximate GOT (MarkovGOT, GOT.ComputeCentrality with approximate=True): on each network type of
+# library.generateNetwork the rankings of the mean-field estimate are compared with the ones of the exact simulation
+# (VectorizedGOT), by rank correlation of the node and edge scores and by the overlap of the most central nodes. As a reference
+# for the noise of the simulation itself, two exact runs with different seeds are compared in the same way.
+
+import sys
+import numpy as np
+from scipy.stats import spearmanr, kendalltau
+import library, GOT, VectorizedGOT
+import datetime
+
+# set GOT parameters
+N=int(sys.argv[1]) if len(sys.argv) > 1 else 5000 #number of nodes
+noThieves=1 #number of thieves per node
+noVDiamonds=N #number of vdiamonds per node
+noEpochs=int(np.power(np.log(N),3)) #number of epochs
+topFraction=0.1 #the fraction of the most central nodes compared
+seed=2018
+
+def compare(first, second):
+    # rank correlations of the node and edge scores of two results and the overlap of their most central nodes
+    noTop = max(int(topFraction * first.nodeScores.shape[0]), 1)
+    overlap = len(set(first.topNodes(noTop).tolist()) & set(second.topNodes(noTop).tolist())) / float(noTop)
+    return [spearmanr(first.nodeScores, second.nodeScores)[0], kendalltau(first.nodeScores, second.nodeScores)[0],
+            spearmanr(first.edgeScores, second.edgeScores)[0], overlap]
+
+print("%d nodes, %d epochs; Spearman and Kendall correlations of the node scores, Spearman correlation of the edge scores, overlap of the top %d%% nodes" % (N, noEpochs, int(100 * topFraction)))
+print("%-12s %-22s %9s %9s %9s %9s %12s" % ("network", "comparison", "nodes rs", "nodes tau", "edges rs", "top", "time"))
+for cnType in library.networkTypes:
+    G = library.generateNetwork(N, cnType, False, seed=seed)
+
+    t1=datetime.datetime.now()
+    exact = VectorizedGOT.ComputeCentrality(G, noThieves, noVDiamonds, noEpochs=noEpochs, seed=seed, historyMode='mean')
+    t2=datetime.datetime.now()
+    approximate = GOT.ComputeCentrality(G, noThieves, noVDiamonds, noEpochs=noEpochs, historyMode='mean', approximate=True)
+    t3=datetime.datetime.now()
+    other = VectorizedGOT.ComputeCentrality(G, noThieves, noVDiamonds, noEpochs=noEpochs, seed=seed + 1, historyMode='mean')
+
+    print("%-12s %-22s %9.4f %9.4f %9.4f %9.3f %12s" % tuple([cnType, "approximate vs exact"] + compare(exact, approximate) + [t3 - t2]))
+    print("%-12s %-22s %9.4f %9.4f %9.4f %9.3f %12s" % tuple([cnType, "exact vs exact (seed)"] + compare(exact, other) + [t2 - t1]))
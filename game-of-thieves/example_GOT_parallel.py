@@ -0,0 +1,55 @@
+# Author: Decebal Constantin Mocanu;
+# Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
+# The software is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
+# For an easy understanding of the software functionality please read the following article.
+
+# If you use this software please cite its corresponding article:
+#@article{Mocanu2018GOT,
+#  author =        {Mocanu, Decebal Constantin and Exarchakos, Georgios and Liotta, Antonio},
+#  journal =       {Scientific Reports},
+#  title =         {Decentralized dynamic understanding of hidden relations in complex networks},
+#  volume =        {8},
+#  year =          {2018},
+#  doi =           {10.1038/s41598-018-19356-4},
+#  url =           {https://www.nature.com/articles/s41598-018-19356-4}
+#}
+
+# Seeded comparison of the multi-process GOT (ParallelGOT) with the sequential vectorized GOT (VectorizedGOT) and with the
+# GOT object engine: with the same seed the vectorized runs have to be identical whatever the number of workers, and the GOT
+# object engine has to give the same result when it is run twice with the same seed.
+
+import numpy as np
+import library, GOT, VectorizedGOT, ParallelGOT
+import datetime
+
+# set GOT parameters
+N=2000 #number of nodes
+noThieves=1 #number of thieves per node
+noVDiamonds=N #number of vdiamonds per node
+noEpochs=100 #number of epochs
+noWorkers=4 #number of worker processes
+seed=2018
+
+G = library.generateNetwork(N, "scale-free", False, seed=seed)
+
+t1=datetime.datetime.now()
+sequential = VectorizedGOT.ComputeCentrality(G, noThieves, noVDiamonds, noEpochs=noEpochs, seed=seed)
+t2=datetime.datetime.now()
+oneWorker = ParallelGOT.ComputeCentrality(G, noThieves, noVDiamonds, noEpochs=noEpochs, noWorkers=1, seed=seed)
+t3=datetime.datetime.now()
+parallel = ParallelGOT.ComputeCentrality(G, noThieves, noVDiamonds, noEpochs=noEpochs, noWorkers=noWorkers, seed=seed)
+t4=datetime.datetime.now()
+objectRuns = [GOT.ComputeCentrality(G.copy(), noThieves, noVDiamonds, noEpochs=10, seed=seed) for i in range(2)]
+
+identicalOne = all([np.array_equal(x, y) for x, y in zip(sequential, oneWorker)])
+identicalMany = all([np.array_equal(x, y) for x, y in zip(sequential, parallel)])
+identicalObject = all([np.array_equal(x, y) for x, y in zip(objectRuns[0], objectRuns[1])])
+print("Sequential run in %s, one worker in %s, %d workers in %s." % (t2 - t1, t3 - t2, noWorkers, t4 - t3))
+print("One worker identical with the sequential run: %s" % identicalOne)
+print("%d workers identical with the sequential run: %s" % (noWorkers, identicalMany))
+print("GOT object engine reproducible with a seed: %s" % identicalObject)
+
+assert identicalOne, "ParallelGOT with one worker differs from VectorizedGOT"
+assert identicalMany, "ParallelGOT with %d workers differs from VectorizedGOT" % noWorkers
+assert identicalObject, "GOT gives different results with the same seed"
@@ -1,6 +1,6 @@
 # Author: Decebal Constantin Mocanu;
 # Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
-# This is a pre-alpha free software and was tested with Python 2.7.12, Matplotlib 2.1.0, Numpy 1.14, NetworkX 2.0;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
 # The software is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
 # For an easy understanding of the software functionality please read the following article.
 
@@ -33,7 +33,7 @@ weighted=False #set this to True if you would like to generate an weighted netwo
 
 # generate a random network (here in you can create or use your own network)
 G= library.generateNetwork(N, cnType, weighted)
-print "Generated a ",cnType," network."
+print("Generated a ",cnType," network.")
 
 # compute nodes and edges centrality with GOT
 t1=datetime.datetime.now()
@@ -45,7 +45,7 @@ t3=datetime.datetime.now()
 [nodesRemovalSizeGiantComponentGOT, nodesRemovalNoConnectedComponentsGOT] = library.nodesRemovalProcedure(G, nodesSortedGOT)
 [edgesRemovalSizeGiantComponentGOT, edgesRemovalNoConnectedComponentsGOT] = library.edgesRemovalProcedure(G, edgesSortedGOT)
 t4=datetime.datetime.now()
-print "GOT stopped after ",stopedEpoch," epochs and run in ",t2-t1," seconds, while nodes and edges removal procedures in ",t4-t3," seconds."
+print("GOT stopped after ",stopedEpoch," epochs and run in ",t2-t1," seconds, while nodes and edges removal procedures in ",t4-t3," seconds.")
 
 # compute nodes centrality with Betweenness centrality
 t1=datetime.datetime.now()
@@ -54,11 +54,10 @@ edgesBetweenessCentrality=nx.edge_betweenness_centrality(G,weight="value")
 t2=datetime.datetime.now()
 
 #process Betweenness centrality results
-centralityNodesBetweeness=np.zeros(N)
-for i in range(N):
-    centralityNodesBetweeness[i] = nodesBetweenessCentrality[i]
-nodesSortedBetweenness=centralityNodesBetweeness.argsort(axis=0)[::-1]
-edgesSortedBetweenness = [x for x in edgesBetweenessCentrality.iteritems()]
+nodesList=list(G.nodes())
+centralityNodesBetweeness=np.array([nodesBetweenessCentrality[node] for node in nodesList])
+nodesSortedBetweenness=[nodesList[i] for i in centralityNodesBetweeness.argsort(axis=0)[::-1]]
+edgesSortedBetweenness = [x for x in edgesBetweenessCentrality.items()]
 edgesSortedBetweenness.sort(key=lambda x: x[1]) # sort by value
 edgesSortedBetweenness.reverse()
 
@@ -67,21 +66,21 @@ t3=datetime.datetime.now()
 [nodesRemovalSizeGiantComponentBetweenness, nodesRemovalNoConnectedComponentsBetweenness]= library.nodesRemovalProcedure(G, nodesSortedBetweenness)
 [edgesRemovalSizeGiantComponentBetweenness, edgesRemovalNoConnectedComponentsBetweenness] = library.edgesRemovalProcedure(G, edgesSortedBetweenness)
 t4=datetime.datetime.now()
-print "Betweenness centrality for nodes and edges run in ",t2-t1," seconds, while nodes and edges removal procedures in ",t4-t3," seconds."
+print("Betweenness centrality for nodes and edges run in ",t2-t1," seconds, while nodes and edges removal procedures in ",t4-t3," seconds.")
 
-print "\nResults:\n"
-print "Area under the curve (AUC) for NODES removal procedure: "
-print "AUC giant component (smaller value is better) with GOT centrality: ",np.sum(nodesRemovalSizeGiantComponentGOT)
-print "AUC giant component (smaller value is better) with Betweenness centrality: ",np.sum(nodesRemovalSizeGiantComponentBetweenness)
-print "AUC number of connected components (higher value is better) with GOT centrality: ",np.sum(nodesRemovalNoConnectedComponentsGOT)
-print "AUC number of connected components (higher value is better) with Betweenness centrality: ",np.sum(nodesRemovalNoConnectedComponentsBetweenness)
+print("\nResults:\n")
+print("Area under the curve (AUC) for NODES removal procedure: ")
+print("AUC giant component (smaller value is better) with GOT centrality: ",np.sum(nodesRemovalSizeGiantComponentGOT))
+print("AUC giant component (smaller value is better) with Betweenness centrality: ",np.sum(nodesRemovalSizeGiantComponentBetweenness))
+print("AUC number of connected components (higher value is better) with GOT centrality: ",np.sum(nodesRemovalNoConnectedComponentsGOT))
+print("AUC number of connected components (higher value is better) with Betweenness centrality: ",np.sum(nodesRemovalNoConnectedComponentsBetweenness))
 
-print "\n"
-print "Area under the curve (AUC) for EDGES removal procedure: "
-print "AUC giant component (smaller value is better) with GOT centrality: ",np.sum(edgesRemovalSizeGiantComponentGOT)
-print "AUC giant component (smaller value is better) with Betweenness centrality: ",np.sum(edgesRemovalSizeGiantComponentBetweenness)
-print "AUC number of connected components (higher value is better) with GOT centrality: ",np.sum(edgesRemovalNoConnectedComponentsGOT)
-print "AUC number of connected components (higher value is better) with Betweenness centrality: ",np.sum(edgesRemovalNoConnectedComponentsBetweenness)
+print("\n")
+print("Area under the curve (AUC) for EDGES removal procedure: ")
+print("AUC giant component (smaller value is better) with GOT centrality: ",np.sum(edgesRemovalSizeGiantComponentGOT))
+print("AUC giant component (smaller value is better) with Betweenness centrality: ",np.sum(edgesRemovalSizeGiantComponentBetweenness))
+print("AUC number of connected components (higher value is better) with GOT centrality: ",np.sum(edgesRemovalNoConnectedComponentsGOT))
+print("AUC number of connected components (higher value is better) with Betweenness centrality: ",np.sum(edgesRemovalNoConnectedComponentsBetweenness))
 
 
 
@@ -1,6 +1,6 @@
 # Author: Decebal Constantin Mocanu;
 # Proof of concept implementation of the Game of Thieves (GoT) - a metric to compute nodes and links centrality in complex networks or graphs;
-# This is a pre-alpha free software and was tested with Python 2.7.12, Matplotlib 2.1.0, Numpy 1.14, NetworkX 2.0;
+# This is a pre-alpha free software; it requires Python >= 3.6, Numpy >= 1.17, NetworkX >= 2.0 (SciPy for the approximate GOT, Matplotlib for the illustration) and was tested with Python 3.11.7, Numpy 2.4.6, NetworkX 3.6.1, SciPy 1.17.1;
 # The code is distributed in the hope that it may be useful, but WITHOUT ANY WARRANTIES; The use of this software is entirely at the user's own risk;
 # For an easy understanding of the code functionality please read the following article.
 
@@ -17,14 +17,19 @@
 
 import numpy as np
 import networkx as nx
+import multiprocessing
+import CSRGraph
 
-def generateWeightedNetwork(G):
+def generateWeightedNetwork(G, rng=None):
     # Input:
     #   G - the network analyzed
+    #   rng - the NumPy RandomState used to draw the weights (default None, the global np.random)
     # Output:
     #   G - a network with random generated weights values
+    if (rng is None):
+        rng = np.random
     for edge in G.edges():
-        v=np.random.randint(1,10)
+        v=rng.randint(1,10)
         G.add_edge(edge[0], edge[1], value=v)
     return G
 
@@ -38,6 +43,96 @@ def generateUnweightedNetwork(G):
         G.add_edge(edge[0], edge[1], value=v)
     return G
 
+def findRoot(parent, i):
+    # find the root of the component of i in the union-find forest parent (with path halving)
+    while (parent[i] != i):
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+def unionComponents(parent, size, i, j):
+    # merge the components of i and j; returns the size of the merged component, or 0 if they were already merged
+    ri = findRoot(parent, i)
+    rj = findRoot(parent, j)
+    if (ri == rj):
+        return 0
+    if (size[ri] < size[rj]):
+        ri, rj = rj, ri
+    parent[rj] = ri
+    size[ri] += size[rj]
+    return size[ri]
+
+def buildRemovalIndex(G):
+    # Input:
+    #   G - the network analyzed
+    # Output:
+    #   index - a dictionary from each node of G to a dense integer index
+    #   neighbours - the list with the neighbours (as indices) of each node
+    N = G.number_of_nodes()
+    index = dict(zip(G.nodes(), range(N)))
+    neighbours = [[index[neighbour] for neighbour in G[node]] for node in G.nodes()]
+    return [index, neighbours]
+
+def edgeEndpoints(edge):
+    # the endpoints of an edge given as (u,v), as [[u,v]] (GOT sortedEdges) or as ((u,v),centrality) (sorted NetworkX dicts items)
+    if (np.ndim(edge[0]) > 0):
+        return edge[0]
+    return edge
+
+def edgesRemovalCurves(N, edgesOrder):
+    # Input:
+    #   N - the number of nodes
+    #   edgesOrder - (M,2) array with the endpoints (as node indices) of the edges in the order of their removal
+    # Output:
+    #   nodesGiant, noComponents - as for edgesRemovalProcedure
+    # The edges are added back with a union-find structure, from the last removed one to the first one, so that the size of
+    # the giant component and the number of components are tracked in near-linear time (instead of recomputing them after each removal)
+    M = len(edgesOrder)
+    nodesGiant=np.zeros(M)
+    noComponents=np.zeros(M)
+    parent = list(range(N))
+    size = [1] * N
+    giant = 1 if N > 0 else 0
+    components = N
+    for k in range(M-1, -1, -1):
+        nodesGiant[k]=giant
+        noComponents[k]=components
+        merged = unionComponents(parent, size, edgesOrder[k][0], edgesOrder[k][1])
+        if (merged > 0):
+            components -= 1
+            giant = max(giant, merged)
+    return [nodesGiant,noComponents]
+
+def nodesRemovalCurves(neighbours, nodesOrder):
+    # Input:
+    #   neighbours - the list with the neighbours (as indices) of each node
+    #   nodesOrder - the node indices in the order of their removal
+    # Output:
+    #   nodesGiant, noComponents - as for nodesRemovalProcedure
+    # The nodes are added back with a union-find structure, from the last removed one to the first one (see edgesRemovalCurves)
+    N=len(neighbours)
+    nodesGiant=np.zeros(N)
+    noComponents=np.zeros(N)
+    parent = list(range(N))
+    size = [1] * N
+    present = [False] * N
+    giant = 0
+    components = 0
+    for k in range(N-1, 0, -1):
+        i = nodesOrder[k]
+        present[i] = True
+        components += 1
+        giant = max(giant, 1)
+        for j in neighbours[i]:
+            if (present[j]):
+                merged = unionComponents(parent, size, i, j)
+                if (merged > 0):
+                    components -= 1
+                    giant = max(giant, merged)
+        nodesGiant[k-1]=giant
+        noComponents[k-1]=components
+    return [nodesGiant,noComponents]
+
 def edgesRemovalProcedure(G,edgesSorted):
     # Input:
     #   G - the network analyzed
@@ -45,17 +140,9 @@ def edgesRemovalProcedure(G,edgesSorted):
     # Output:
     #   nodesGiant - an array with the remaining size of the giant component after each edge removed
     #   nodesGiant - an array with the remaining number of connected components after each edge removed
-    M = G.number_of_edges()
-    nodesGiant=np.zeros(M)
-    noComponents=np.zeros(M)
-    H=G.copy()
-    for k in range(M):
-        H.remove_edge(edgesSorted[k][0][0],edgesSorted[k][0][1])
-        conngen=nx.connected_components(H)
-        conn=sorted(conngen, key = len, reverse=True)
-        nodesGiant[k]=len(conn[0])
-        noComponents[k]=len(conn)
-    return [nodesGiant,noComponents]
+    index = dict(zip(G.nodes(), range(G.number_of_nodes())))
+    edgesOrder = [[index[e[0]], index[e[1]]] for e in map(edgeEndpoints, edgesSorted)]
+    return edgesRemovalCurves(G.number_of_nodes(), edgesOrder)
 
 def nodesRemovalProcedure(G,nodesSorted):
     # Input:
@@ -64,42 +151,222 @@ def nodesRemovalProcedure(G,nodesSorted):
     # Output:
     #   nodesGiant - an array with the remaining size of the giant component after each node removed
     #   nodesGiant - an array with the remaining number of connected components after each node removed
-    N=G.number_of_nodes()
-    nodesGiant=np.zeros(N)
-    noComponents=np.zeros(N)
-    H=G.copy()
-    for k in range(N-1):
-        H.remove_node(nodesSorted[k])
-        conngen=nx.connected_components(H)
-        conn=sorted(conngen, key = len, reverse=True)
-        nodesGiant[k]=len(conn[0])
-        noComponents[k]=len(conn)
-    return [nodesGiant,noComponents]
+    [index, neighbours] = buildRemovalIndex(G)
+    return nodesRemovalCurves(neighbours, [index[node] for node in nodesSorted])
+
+# state of the worker processes of evaluateRankings
+removalWorkerState = {}
+
+def initRemovalWorker(kind, N, neighbours):
+    removalWorkerState['kind'] = kind
+    removalWorkerState['N'] = N
+    removalWorkerState['neighbours'] = neighbours
 
-def generateNetwork(N,cnType,weighted):
+def evaluateRemovalOrder(order):
+    if (removalWorkerState['kind'] == 'nodes'):
+        return nodesRemovalCurves(removalWorkerState['neighbours'], order)
+    return edgesRemovalCurves(removalWorkerState['N'], order)
+
+def evaluateRankings(G, rankings, kind='nodes', noProcesses=1):
+    # Evaluate many rankings (e.g. GOT, betweenness, ...) against the same nodes or edges removal procedure
+    # Input:
+    #   G - the network analyzed
+    #   rankings - a list of rankings, each one with all nodes (kind='nodes') or all edges (kind='edges', in any of the
+    #              formats accepted by edgesRemovalProcedure) sorted according with their centrality
+    #   kind - 'nodes' or 'edges' removal procedure
+    #   noProcesses - number of processes over which the rankings are spread (default 1, in the current process)
+    # Output:
+    #   a dictionary with:
+    #     'giant' - (noRankings, length) array with the remaining size of the giant component after each removal
+    #     'components' - (noRankings, length) array with the remaining number of connected components after each removal
+    #     'aucGiant' - the area under each giant component curve (smaller value is better)
+    #     'aucComponents' - the area under each number of connected components curve (higher value is better)
+    if (kind not in ['nodes', 'edges']):
+        raise ValueError("kind has to be 'nodes' or 'edges'")
+    N = G.number_of_nodes()
+
+    # the graph index is built only once for all rankings
+    [index, neighbours] = buildRemovalIndex(G)
+    if (kind == 'nodes'):
+        orders = [[index[node] for node in ranking] for ranking in rankings]
+    else:
+        orders = [[[index[e[0]], index[e[1]]] for e in map(edgeEndpoints, ranking)] for ranking in rankings]
+
+    initRemovalWorker(kind, N, neighbours)
+    if (noProcesses > 1 and len(orders) > 1):
+        pool = multiprocessing.Pool(min(noProcesses, len(orders)), initRemovalWorker, (kind, N, neighbours))
+        try:
+            curves = pool.map(evaluateRemovalOrder, orders)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        curves = [evaluateRemovalOrder(order) for order in orders]
+
+    result = {}
+    result['giant'] = np.asarray([c[0] for c in curves])
+    result['components'] = np.asarray([c[1] for c in curves])
+    result['aucGiant'] = np.sum(result['giant'], axis=1)
+    result['aucComponents'] = np.sum(result['components'], axis=1)
+    return result
+
+def randomState(seed):
+    # the NumPy random generator of the library functions: the global np.random if seed is None, a RandomState otherwise
+    if (seed is None):
+        return np.random
+    return np.random.RandomState(seed)
+
+def generateNetwork(N,cnType,weighted,maxRetries=100,seed=None):
     # Input:
     #   N - number of nodes
     #   cnType  - network type (i.e. scale-free, small-world, Erdos-Renyi random graph)
     #   weighted - weighted or unweighted network
+    #   maxRetries - how many times a disconnected network is generated again before giving up (default 100)
+    #   seed - seed of the random generator (default None, the global random generators)
     # Output:
     #   G - a network with random generated topology acoording with the input parameters
 
-    if (cnType == "scale-free"):
-        G = nx.powerlaw_cluster_graph(N, 5, 0.3)
-        while (nx.is_connected(G) == False):
-            G = nx.powerlaw_cluster_graph(N, 5, 0.3)
-    if (cnType == "small-world"):
-        G = nx.newman_watts_strogatz_graph(N, 6, 0.6)
-        while (nx.is_connected(G) == False):
-            G = nx.newman_watts_strogatz_graph(N, 6, 0.6)
-    if (cnType == "Erdos-Renyi"):
-        G = nx.fast_gnp_random_graph(N, 0.01)
-        while (nx.is_connected(G) == False):
-            G = nx.fast_gnp_random_graph(N, 0.01)
+    if (cnType not in networkTypes):
+        raise ValueError("unknown network type " + str(cnType) + ", it has to be one of " + str(networkTypes))
+    rng = randomState(seed)
+    for attempt in range(maxRetries):
+        graphSeed = None if seed is None else rng.randint(2 ** 31 - 1)
+        if (cnType == "scale-free"):
+            G = nx.powerlaw_cluster_graph(N, 5, 0.3, seed=graphSeed)
+        if (cnType == "small-world"):
+            G = nx.newman_watts_strogatz_graph(N, 6, 0.6, seed=graphSeed)
+        if (cnType == "Erdos-Renyi"):
+            G = nx.fast_gnp_random_graph(N, 0.01, seed=graphSeed)
+        if (nx.is_connected(G)):
+            break
+    else:
+        raise RuntimeError("no connected " + cnType + " network with " + str(N) + " nodes was generated in " + str(maxRetries) + " attempts")
 
     if (weighted):
-        G = generateWeightedNetwork(G)
+        G = generateWeightedNetwork(G, rng)
     else:
         G = generateUnweightedNetwork(G)
 
-    return G
\ No newline at end of file
+    return G
+
+networkTypes = ["scale-free", "small-world", "Erdos-Renyi"]
+
+def uniqueEdges(N, u, v):
+    # Output:
+    #   (M,2) array with the distinct undirected edges among (u,v), without self loops, each one as (min, max)
+    keep = u != v
+    a = np.minimum(u[keep], v[keep]).astype(np.int64)
+    b = np.maximum(u[keep], v[keep]).astype(np.int64)
+    codes = np.sort(a * N + b)
+    codes = codes[np.concatenate(([True], codes[1:] != codes[:-1]))]
+    return np.stack((codes // N, codes % N), axis=1)
+
+def scaleFreeEdges(N, m, rng):
+    # Barabasi-Albert preferential attachment with the linear time method of Batagelj and Brandes, fully vectorized:
+    # edge e links the new node m + e//m to the endpoint stored at a uniformly drawn position r < 2e of the list of all
+    # previous edges endpoints; the positions pointing to targets are followed back until a source is reached
+    noLinks = (N - m) * m
+    e = np.arange(noLinks, dtype=np.int64)
+    source = m + e // m
+    r = (rng.random_sample(noLinks) * (2 * e)).astype(np.int64)
+    r[:m] = 2 * noLinks
+    target = np.full(noLinks, -1, dtype=np.int64)
+    target[:m] = e[:m]
+    pointer = r.copy()
+    unresolved = np.arange(m, noLinks)
+    while (unresolved.shape[0] > 0):
+        p = pointer[unresolved]
+        isSource = p % 2 == 0
+        target[unresolved[isSource]] = source[p[isSource] // 2]
+        fromInitial = (~isSource) & (p // 2 < m)
+        target[unresolved[fromInitial]] = p[fromInitial] // 2
+        unresolved = unresolved[(~isSource) & (~fromInitial)]
+        pointer[unresolved] = r[pointer[unresolved] // 2]
+    return uniqueEdges(N, source, target)
+
+def smallWorldEdges(N, k, p, rng):
+    # Newman-Watts-Strogatz: a ring lattice where each node is linked with its k/2 neighbours on each side, plus for each
+    # lattice edge, with probability p, a shortcut from its first endpoint to a random node
+    ring = np.repeat(np.arange(N, dtype=np.int64), k // 2)
+    lattice = (ring + np.tile(np.arange(1, k // 2 + 1), N)) % N
+    shortcut = rng.random_sample(ring.shape[0]) < p
+    randomNodes = rng.randint(0, N, size=int(shortcut.sum()))
+    return uniqueEdges(N, np.concatenate((ring, ring[shortcut])), np.concatenate((lattice, randomNodes)))
+
+def erdosRenyiEdges(N, p, rng):
+    # G(N,p): the number of edges is drawn from the binomial distribution, then the distinct edges are drawn uniformly
+    noPairs = N * (N - 1) // 2
+    M = rng.binomial(noPairs, p)
+    edges = np.zeros((0, 2), dtype=np.int64)
+    while (edges.shape[0] < M):
+        size = int(1.1 * (M - edges.shape[0])) + 16
+        u = rng.randint(0, N, size=size)
+        v = rng.randint(0, N, size=size)
+        edges = uniqueEdges(N, np.concatenate((edges[:, 0], u)), np.concatenate((edges[:, 1], v)))
+    return edges[np.sort(rng.choice(edges.shape[0], M, replace=False))]
+
+def componentLabels(N, edges):
+    # Output:
+    #   for each node, the smallest node index of its connected component (min-label propagation with pointer jumping)
+    labels = np.arange(N)
+    while (True):
+        previous = labels.copy()
+        np.minimum.at(labels, edges[:, 0], labels[edges[:, 1]])
+        np.minimum.at(labels, edges[:, 1], labels[edges[:, 0]])
+        while (True):
+            jumped = labels[labels]
+            if (np.array_equal(jumped, labels)):
+                break
+            labels = jumped
+        if (np.array_equal(labels, previous)):
+            return labels
+
+def generateNetworkCSR(N, cnType, weighted, connectivity="giant", maxRetries=10, averageDegree=10, seed=None):
+    # Fast version of generateNetwork: the topology is drawn with vectorized NumPy operations, all the weights are drawn in
+    # one call and the network is built directly in the compact format used by the GOT engines (no NetworkX graph)
+    # The scale-free networks are Barabasi-Albert networks (5 links per new node, as in generateNetwork, but without the
+    # triad formation step of powerlaw_cluster_graph, thus with a lower clustering coefficient)
+    # The Erdos-Renyi networks have a fixed average degree instead of the fixed p=0.01 of generateNetwork (the two are the same
+    # for 1000 nodes), so that they neither fall apart for small N nor explode for large N
+    # Input:
+    #   N - number of nodes
+    #   cnType  - network type (i.e. scale-free, small-world, Erdos-Renyi random graph)
+    #   weighted - weighted or unweighted network
+    #   connectivity - "giant" to keep only the giant component of a disconnected network (with its nodes relabeled
+    #                  from 0), or "retry" to generate the network again, at most maxRetries times
+    #   averageDegree - the expected average degree of the Erdos-Renyi networks (default 10)
+    #   seed - seed of the random generator (default None, the global np.random)
+    # Output:
+    #   csr - a CSRGraph with random generated topology acoording with the input parameters (csr.noNodes can be
+    #         smaller than N if the giant component was extracted)
+    if (cnType not in networkTypes):
+        raise ValueError("unknown network type " + str(cnType) + ", it has to be one of " + str(networkTypes))
+    if (connectivity not in ["giant", "retry"]):
+        raise ValueError("connectivity has to be 'giant' or 'retry'")
+    rng = randomState(seed)
+    for attempt in range(maxRetries):
+        if (cnType == "scale-free"):
+            edges = scaleFreeEdges(N, 5, rng)
+        if (cnType == "small-world"):
+            edges = smallWorldEdges(N, 6, 0.6, rng)
+        if (cnType == "Erdos-Renyi"):
+            edges = erdosRenyiEdges(N, min(1.0, float(averageDegree) / (N - 1)), rng)
+        labels = componentLabels(N, edges)
+        noComponents = np.count_nonzero(labels == np.arange(N))
+        if (noComponents == 1 or connectivity == "giant"):
+            break
+    else:
+        raise RuntimeError("no connected " + cnType + " network with " + str(N) + " nodes was generated in " + str(maxRetries) + " attempts (the last one had " + str(noComponents) + " components)")
+
+    if (noComponents > 1):
+        giantLabel = np.bincount(labels).argmax()
+        inGiant = labels == giantLabel
+        newIndex = np.cumsum(inGiant) - 1
+        edges = newIndex[edges[inGiant[edges[:, 0]]]]
+        N = int(inGiant.sum())
+
+    if (weighted):
+        weights = rng.randint(1, 10, size=edges.shape[0])
+    else:
+        weights = np.ones(edges.shape[0])
+    return CSRGraph.CSRGraph(N, edges, weights)